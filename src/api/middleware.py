@@ -5,13 +5,12 @@ Provides request tracing and error handling capabilities.
 """
 
 import logging
+import os
 import time
 from contextvars import ContextVar
 from typing import Optional
-from uuid import uuid4
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -24,86 +23,112 @@ def get_request_id() -> Optional[str]:
     return request_id_var.get()
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware that assigns a unique ID to each request.
 
     The request ID is:
-    - Generated as a UUID4 if not provided by the client
+    - Generated as 32 random hex characters if not provided by the client
     - Stored in a context variable for access throughout the request
     - Added to the response headers as X-Request-ID
-    - Logged with each request for tracing
+    - Logged once per request (on response start) for tracing
 
     Clients can optionally provide their own request ID via the
     X-Request-ID header for end-to-end tracing.
+
+    Implemented as a pure ASGI middleware (rather than BaseHTTPMiddleware)
+    so requests are handled inline against the raw scope/send, without the
+    extra task, memory channel and Request/Response objects per request.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get request ID from header or generate new one
-        request_id = request.headers.get("X-Request-ID")
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
         if not request_id:
-            request_id = str(uuid4())
+            # Same 128 bits of entropy as uuid4() without building a UUID object
+            request_id = os.urandom(16).hex()
 
-        # Store in context variable for access anywhere
-        token = request_id_var.set(request_id)
+        # Store in context variable for access anywhere. The ASGI server runs
+        # each request cycle in its own task, and tasks copy the context on
+        # creation (PEP 567), so the value never leaks to other requests and
+        # no reset is needed.
+        request_id_var.set(request_id)
 
-        # Add to request state for easy access in route handlers
-        request.state.request_id = request_id
+        # Add to request state for easy access in route handlers (request.state.request_id)
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
         # Track request timing
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate duration
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+                # Add request ID to response headers
+                headers = list(message.get("headers", []))
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                message["headers"] = headers
+
+                # Single access-log line per request
+                logger.info(
+                    "Request completed",
+                    extra={
+                        "request_id": request_id,
+                        "method": method,
+                        "path": path,
+                        "client_ip": client_ip,
+                        "status_code": message["status"],
+                        "duration_ms": round(duration_ms, 2),
+                    },
+                )
+            await send(message)
 
         try:
-            # Log incoming request
-            logger.info(
-                "Request started",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "client_ip": request.client.host if request.client else "unknown",
-                },
-            )
+            # Log incoming request (debug only; the completed line carries the same fields)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Request started",
+                    extra={
+                        "request_id": request_id,
+                        "method": method,
+                        "path": path,
+                        "client_ip": client_ip,
+                    },
+                )
 
             # Process request
-            response = await call_next(request)
-
-            # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-
-            # Log completed request
-            logger.info(
-                "Request completed",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_ms": round(duration_ms, 2),
-                },
-            )
-
-            return response
+            await self.app(scope, receive, send_wrapper)
 
         except Exception as e:
             # Calculate duration even for errors
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             logger.error(
                 "Request failed",
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
+                    "client_ip": client_ip,
                     "error": str(e),
                     "duration_ms": round(duration_ms, 2),
                 },
             )
             raise
-
-        finally:
-            # Reset context variable
-            request_id_var.reset(token)
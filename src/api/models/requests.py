@@ -7,10 +7,11 @@ Security:
 - party_id/customer_code have flexible validation (external IDs from accounting software)
 """
 
+import re
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class EmailContent(BaseModel):
@@ -59,6 +60,9 @@ class BehaviorInfo(BaseModel):
 class ObligationInfo(BaseModel):
     """Single invoice/obligation."""
 
+    # Leaf records are read-only once parsed (also TouchHistory, PromiseHistory)
+    model_config = ConfigDict(frozen=True)
+
     invoice_number: str
     original_amount: float
     amount_due: float
@@ -82,6 +86,8 @@ class CommunicationInfo(BaseModel):
 class TouchHistory(BaseModel):
     """Single touch record."""
 
+    model_config = ConfigDict(frozen=True)
+
     sent_at: datetime
     tone: str
     sender_level: int
@@ -91,6 +97,8 @@ class TouchHistory(BaseModel):
 class PromiseHistory(BaseModel):
     """Single promise record."""
 
+    model_config = ConfigDict(frozen=True)
+
     promise_date: str
     promise_amount: Optional[float] = None
     outcome: str  # kept, broken, pending
@@ -172,6 +180,23 @@ PROMPT_INJECTION_PATTERNS = [
     "bypass",
 ]
 
+# All patterns folded into one case-insensitive alternation so the input is
+# scanned once by the regex engine instead of once per pattern
+_INJECTION_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in PROMPT_INJECTION_PATTERNS), re.IGNORECASE
+)
+# Inputs shorter than every pattern cannot match, so skip the regex scan
+_MIN_INJECTION_LEN = min(len(pattern) for pattern in PROMPT_INJECTION_PATTERNS)
+
+
+# Closed value sets are Literal types so pydantic-core validates them with a
+# set membership check (and OpenAPI shows an enum) instead of a regex match
+DraftTone = Literal[
+    "friendly_reminder", "professional", "firm", "final_notice", "concerned_inquiry"
+]
+DraftObjective = Literal["follow_up", "promise_reminder", "escalation", "initial_contact"]
+ProposedAction = Literal["send_email", "create_case", "escalate", "close_case"]
+
 
 class ClassifyRequest(BaseModel):
     """Request to classify an inbound email."""
@@ -184,14 +209,8 @@ class GenerateDraftRequest(BaseModel):
     """Request to generate a collection email draft."""
 
     context: CaseContext
-    tone: str = Field(
-        default="professional",
-        pattern=r"^(friendly_reminder|professional|firm|final_notice|concerned_inquiry)$",
-    )
-    objective: Optional[str] = Field(
-        default=None,
-        pattern=r"^(follow_up|promise_reminder|escalation|initial_contact)$",
-    )
+    tone: DraftTone = "professional"
+    objective: Optional[DraftObjective] = None
     # SECURITY: Limited to 1000 chars with prompt injection detection
     custom_instructions: Optional[str] = Field(default=None, max_length=1000)
 
@@ -203,13 +222,11 @@ class GenerateDraftRequest(BaseModel):
 
         Checks for common patterns used to manipulate LLM behavior.
         """
-        if v is None:
+        if v is None or len(v) < _MIN_INJECTION_LEN:
             return v
 
-        v_lower = v.lower()
-        for pattern in PROMPT_INJECTION_PATTERNS:
-            if pattern in v_lower:
-                raise ValueError("Invalid instructions: contains potentially unsafe pattern")
+        if _INJECTION_RE.search(v):
+            raise ValueError("Invalid instructions: contains potentially unsafe pattern")
         return v
 
 
@@ -217,14 +234,8 @@ class EvaluateGatesRequest(BaseModel):
     """Request to evaluate gates before taking action."""
 
     context: CaseContext
-    proposed_action: str = Field(
-        ...,
-        pattern=r"^(send_email|create_case|escalate|close_case)$",
-    )
-    proposed_tone: Optional[str] = Field(
-        default=None,
-        pattern=r"^(friendly_reminder|professional|firm|final_notice|concerned_inquiry)$",
-    )
+    proposed_action: ProposedAction
+    proposed_tone: Optional[DraftTone] = None
 
 
 class EvaluateGatesBatchRequest(BaseModel):
@@ -236,11 +247,5 @@ class EvaluateGatesBatchRequest(BaseModel):
     """
 
     contexts: List[CaseContext] = Field(..., max_length=100)  # Max 100 parties per batch
-    proposed_action: str = Field(
-        ...,
-        pattern=r"^(send_email|create_case|escalate|close_case)$",
-    )
-    proposed_tone: Optional[str] = Field(
-        default=None,
-        pattern=r"^(friendly_reminder|professional|firm|final_notice|concerned_inquiry)$",
-    )
+    proposed_action: ProposedAction
+    proposed_tone: Optional[DraftTone] = None
@@ -16,14 +16,15 @@ from slowapi.util import get_remote_address
 from src.api.errors import ErrorResponse
 from src.api.models.requests import ClassifyRequest
 from src.api.models.responses import ClassifyResponse
+from src.api.routing import ORJSONRoute
 from src.config.settings import settings
 from src.engine.classifier import classifier
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 # Rate limiter (uses app.state.limiter from main.py)
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, enabled=settings.rate_limit_enabled)
 
 
 @router.post(
@@ -43,7 +44,17 @@ async def classify_email(request: Request, classify_request: ClassifyRequest) ->
     Returns classification (COOPERATIVE, PROMISE, DISPUTE, etc.),
     confidence score, and any extracted data.
     """
-    logger.info(f"Classifying email for party: {classify_request.context.party.party_id}")
+    party_id = classify_request.context.party.party_id
     result = await classifier.classify(classify_request)
-    logger.info(f"Classification: {result.classification} ({result.confidence:.2f})")
+    logger.info(
+        "Classified email for party %s: %s (%.2f)",
+        party_id,
+        result.classification,
+        result.confidence,
+        extra={
+            "party_id": party_id,
+            "classification": result.classification,
+            "confidence": result.confidence,
+        },
+    )
     return result
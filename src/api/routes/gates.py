@@ -8,8 +8,8 @@ Security:
 - Rate limited: configurable via settings (default 100/minute for internal service calls)
 """
 
-import asyncio
 import logging
+from datetime import datetime, timezone
 
 from fastapi import APIRouter, Request
 from slowapi import Limiter
@@ -22,14 +22,15 @@ from src.api.models.responses import (
     EvaluateGatesResponse,
     PartyGateResult,
 )
+from src.api.routing import ORJSONRoute, json_body_openapi, parse_json_body
 from src.config.settings import settings
 from src.engine.gate_evaluator import gate_evaluator
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 # Rate limiter (uses app.state.limiter from main.py)
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, enabled=settings.rate_limit_enabled)
 
 
 @router.post(
@@ -40,19 +41,23 @@ limiter = Limiter(key_func=get_remote_address)
         500: {"model": ErrorResponse, "description": "LLM or internal error"},
         503: {"model": ErrorResponse, "description": "LLM provider unavailable"},
     },
+    openapi_extra=json_body_openapi(EvaluateGatesRequest),
 )
 @limiter.limit(settings.rate_limit_gates)
-async def evaluate_gates(
-    request: Request, gates_request: EvaluateGatesRequest
-) -> EvaluateGatesResponse:
+async def evaluate_gates(request: Request) -> EvaluateGatesResponse:
     """
     Evaluate gates before allowing a collection action.
 
     Returns whether action is allowed and individual gate results.
     """
-    logger.info(f"Evaluating gates for action: {gates_request.proposed_action}")
+    gates_request = parse_json_body(EvaluateGatesRequest, await request.body())
     result = await gate_evaluator.evaluate(gates_request)
-    logger.info(f"Gates evaluation: allowed={result.allowed}")
+    logger.info(
+        "Gates evaluation for action %s: allowed=%s",
+        gates_request.proposed_action,
+        result.allowed,
+        extra={"proposed_action": gates_request.proposed_action, "allowed": result.allowed},
+    )
     return result
 
 
@@ -63,62 +68,71 @@ async def evaluate_gates(
         429: {"description": "Rate limit exceeded"},
         500: {"model": ErrorResponse, "description": "Internal error"},
     },
+    openapi_extra=json_body_openapi(EvaluateGatesBatchRequest),
 )
 @limiter.limit(settings.rate_limit_gates)
-async def evaluate_gates_batch(
-    request: Request, batch_request: EvaluateGatesBatchRequest
-) -> EvaluateGatesBatchResponse:
+async def evaluate_gates_batch(request: Request) -> EvaluateGatesBatchResponse:
     """
     Evaluate gates for multiple parties at once.
 
     Since gate evaluation is deterministic (no LLM calls), this endpoint
-    efficiently evaluates all parties in parallel and returns which ones
+    evaluates all parties in a single pass and returns which ones
     are allowed to proceed with draft generation.
 
     This reduces HTTP overhead compared to calling /evaluate-gates N times.
     """
-    logger.info(
-        f"Batch evaluating gates for {len(batch_request.contexts)} parties, "
-        f"action: {batch_request.proposed_action}"
-    )
-
-    # Create individual requests for each context
-    async def evaluate_single(context):
-        single_request = EvaluateGatesRequest(
-            context=context,
-            proposed_action=batch_request.proposed_action,
-            proposed_tone=batch_request.proposed_tone,
+    # Up to 100 nested contexts: validate the raw bytes in one pass
+    batch_request = parse_json_body(EvaluateGatesBatchRequest, await request.body())
+    # Gate evaluation is synchronous and CPU-only, so evaluate each context
+    # inline rather than fanning out one coroutine per party
+    # One clock read for the whole batch; day-granularity gates don't need more
+    now = datetime.now(timezone.utc)
+    results = []
+    allowed_count = 0
+    for context in batch_request.contexts:
+        result = gate_evaluator.evaluate_context(
+            context, batch_request.proposed_action, batch_request.proposed_tone, now=now
         )
-        result = await gate_evaluator.evaluate(single_request)
 
-        # Find blocking gate if not allowed
+        # Count allowed parties and find the blocking gate in the same pass
         blocking_gate = None
-        if not result.allowed:
-            for gate_name, gate_result in result.gate_results.items():
-                if not gate_result.passed:
-                    blocking_gate = gate_name
-                    break
-
-        return PartyGateResult(
-            party_id=context.party.party_id,
-            customer_code=context.party.customer_code,
-            allowed=result.allowed,
-            gate_results=result.gate_results,
-            recommended_action=result.recommended_action,
-            blocking_gate=blocking_gate,
+        if result.allowed:
+            allowed_count += 1
+        else:
+            blocking_gate = next(
+                (name for name, gate in result.gate_results.items() if not gate.passed), None
+            )
+
+        # Every field below comes from the already-validated CaseContext or the
+        # evaluator's own GateResult models, so skip re-running validation
+        results.append(
+            PartyGateResult.model_construct(
+                party_id=context.party.party_id,
+                customer_code=context.party.customer_code,
+                allowed=result.allowed,
+                gate_results=result.gate_results,
+                recommended_action=result.recommended_action,
+                blocking_gate=blocking_gate,
+            )
         )
 
-    # Evaluate all parties concurrently
-    results = await asyncio.gather(*[evaluate_single(ctx) for ctx in batch_request.contexts])
-
-    allowed_count = sum(1 for r in results if r.allowed)
     blocked_count = len(results) - allowed_count
 
-    logger.info(f"Batch gate evaluation complete: {allowed_count} allowed, {blocked_count} blocked")
+    logger.info(
+        "Batch gate evaluation for action %s complete: %d allowed, %d blocked",
+        batch_request.proposed_action,
+        allowed_count,
+        blocked_count,
+        extra={
+            "proposed_action": batch_request.proposed_action,
+            "allowed_count": allowed_count,
+            "blocked_count": blocked_count,
+        },
+    )
 
     return EvaluateGatesBatchResponse(
         total=len(results),
         allowed_count=allowed_count,
         blocked_count=blocked_count,
-        results=list(results),
+        results=results,
     )
@@ -16,14 +16,15 @@ from slowapi.util import get_remote_address
 from src.api.errors import ErrorResponse
 from src.api.models.requests import GenerateDraftRequest
 from src.api.models.responses import GenerateDraftResponse
+from src.api.routing import ORJSONRoute
 from src.config.settings import settings
 from src.engine.generator import generator
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 # Rate limiter (uses app.state.limiter from main.py)
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, enabled=settings.rate_limit_enabled)
 
 
 @router.post(
@@ -44,7 +45,12 @@ async def generate_draft(
 
     Returns subject, body, and metadata about the generated draft.
     """
-    logger.info(f"Generating draft for party: {generate_request.context.party.party_id}")
+    party_id = generate_request.context.party.party_id
     result = await generator.generate(generate_request)
-    logger.info(f"Generated draft with tone: {result.tone_used}")
+    logger.info(
+        "Generated draft for party %s with tone: %s",
+        party_id,
+        result.tone_used,
+        extra={"party_id": party_id, "tone_used": result.tone_used},
+    )
     return result
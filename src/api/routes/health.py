@@ -2,23 +2,100 @@
 Health check API endpoints.
 
 GET /ping   - Simple liveness check (for Docker, no LLM calls)
-GET /health - Full health check with LLM provider verification (expensive, use sparingly)
+GET /health - Full health check with LLM provider status (refreshed in the background)
 """
 
+import asyncio
 import logging
 import time
+from typing import Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
 
 from src.api.models.responses import HealthResponse
+from src.config.settings import settings
 from src.llm.factory import llm_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Track service start time for uptime calculation
-_start_time = time.time()
+# Track service start time for uptime calculation (monotonic, immune to clock changes)
+_start_ns = time.monotonic_ns()
+
+# Last LLM provider health result, refreshed by run_health_refresher()
+_last_llm_health: Optional[dict] = None
+_llm_health_lock = asyncio.Lock()
+
+# Provider/model identity fields, fixed for the process lifetime
+_health_template: Optional[dict] = None
+
+
+def _get_health_template() -> dict:
+    """Build the static part of HealthResponse on first use."""
+    global _health_template
+
+    if _health_template is None:
+        fallback = llm_client.fallback
+        _health_template = {
+            "version": "0.1.0",
+            "provider": llm_client.provider_name,
+            "model": llm_client.model_name,
+            "fallback_provider": fallback.provider_name if fallback else None,
+            "fallback_model": fallback.model_name if fallback else None,
+        }
+    return _health_template
+
+
+async def _probe_llm_health() -> dict:
+    """Probe the LLM providers and cache the result; call with the lock held."""
+    global _last_llm_health
+
+    try:
+        _last_llm_health = await llm_client.health_check()
+    except Exception as e:
+        logger.warning("LLM health check failed: %s", e)
+        _last_llm_health = {
+            "primary": {"status": "unhealthy", "error": str(e)},
+            "fallback": {"status": "unknown"},
+        }
+    return _last_llm_health
+
+
+async def refresh_llm_health() -> dict:
+    """
+    Probe the LLM providers now and cache the result.
+
+    Used by the periodic refresher. Provider errors are recorded as
+    unhealthy rather than raised.
+    """
+    async with _llm_health_lock:
+        return await _probe_llm_health()
+
+
+async def get_llm_health() -> dict:
+    """
+    Return the cached LLM health, probing only if nothing is cached yet.
+
+    Requests that queue on the lock during a cold-start probe re-check the
+    cache once they acquire it, so they share that probe instead of each
+    running another.
+    """
+    if _last_llm_health is not None:
+        return _last_llm_health
+
+    async with _llm_health_lock:
+        if _last_llm_health is not None:
+            return _last_llm_health
+        return await _probe_llm_health()
+
+
+async def run_health_refresher(interval_seconds: Optional[int] = None) -> None:
+    """Refresh the cached LLM health every interval until cancelled."""
+    interval = interval_seconds or settings.health_refresh_interval_seconds
+    while True:
+        await refresh_llm_health()
+        await asyncio.sleep(interval)
 
 
 class PingResponse(BaseModel):
@@ -36,18 +113,19 @@ async def ping() -> PingResponse:
     Use this for Docker health checks to avoid expensive API calls.
     Returns immediately with basic service status.
     """
-    uptime = time.time() - _start_time
+    uptime = (time.monotonic_ns() - _start_ns) / 1e9
     return PingResponse(status="ok", uptime_seconds=round(uptime, 2))
 
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
     """
-    Full health check with LLM provider verification.
+    Full health check with LLM provider status.
 
-    WARNING: This endpoint makes actual API calls to Gemini and OpenAI
-    to verify they are responding. Use sparingly (e.g., every 15 minutes)
-    to avoid unnecessary API costs.
+    LLM providers are probed by a background task (see run_health_refresher)
+    every HEALTH_REFRESH_INTERVAL_SECONDS, so this endpoint only reads the
+    cached result and is safe to poll from load balancers. If no probe has
+    completed yet, one is run inline.
 
     Returns:
         - status: healthy/degraded/unhealthy
@@ -61,23 +139,15 @@ async def health_check() -> HealthResponse:
         - fallback_available: whether fallback is healthy
         - uptime_seconds: API uptime
     """
-    logger.debug("Running full health check (includes LLM API calls)")
-    uptime = time.time() - _start_time
+    uptime = (time.monotonic_ns() - _start_ns) / 1e9
 
-    # Check LLM health (makes actual API calls)
-    llm_health = await llm_client.health_check()
+    llm_health = await get_llm_health()
     primary_healthy = llm_health["primary"]["status"] == "healthy"
     fallback_status = llm_health["fallback"].get("status", "disabled")
 
-    logger.debug(f"Health check complete: primary={primary_healthy}, fallback={fallback_status}")
-
-    return HealthResponse(
+    return HealthResponse.model_construct(
+        **_get_health_template(),
         status="healthy" if primary_healthy else "degraded",
-        version="0.1.0",
-        provider=llm_client.provider_name,
-        model=llm_client.model_name,
-        fallback_provider=llm_client.fallback.provider_name if llm_client.fallback else None,
-        fallback_model=llm_client.fallback.model_name if llm_client.fallback else None,
         fallback_count=llm_client.fallback_count,
         model_available=primary_healthy,
         fallback_available=fallback_status == "healthy",
@@ -0,0 +1,78 @@
+"""
+Custom request/route classes for the Solvix AI Engine.
+
+Request bodies are decoded with orjson instead of the stdlib json module
+before Pydantic validation. Validation errors and the OpenAPI schema are
+unchanged since FastAPI still drives body parsing.
+
+Endpoints with large bodies can instead validate the raw bytes in one step
+with parse_json_body(), documenting the body via json_body_openapi().
+"""
+
+from typing import Any, Callable, Coroutine, Dict, Type, TypeVar
+
+import orjson
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.constants import REF_TEMPLATE
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class ORJSONRequest(Request):
+    """Request that decodes its JSON body with orjson."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI
+            # still reports malformed bodies as 422 json_invalid
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that hands handlers an ORJSONRequest."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
+
+
+def parse_json_body(model: Type[ModelT], body: bytes) -> ModelT:
+    """
+    Validate a raw JSON request body straight into a Pydantic model.
+
+    pydantic-core parses and validates the bytes in a single pass, without
+    building the intermediate dict FastAPI's body parsing produces. Errors
+    are raised as RequestValidationError so clients still get the usual 422.
+    """
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+            body=body,
+        ) from e
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    OpenAPI requestBody for endpoints that read the body via parse_json_body().
+
+    Nested models are referenced from components, so they must also be used
+    by a regular FastAPI body parameter elsewhere in the app.
+    """
+    schema = model.model_json_schema(ref_template=REF_TEMPLATE)
+    schema.pop("$defs", None)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
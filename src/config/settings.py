@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from pydantic import ConfigDict, field_validator
+from pydantic import ConfigDict
 from pydantic_settings import BaseSettings
 
 
@@ -17,12 +17,6 @@ class Settings(BaseSettings):
     # Example: "https://app.solvix.com,https://admin.solvix.com"
     cors_allowed_origins: str = ""  # Comma-separated list, empty = allow all in debug mode
 
-    @field_validator("cors_allowed_origins")
-    @classmethod
-    def parse_cors_origins(cls, v: str) -> str:
-        # Just validate it's a string, parsing happens in get_cors_origins()
-        return v
-
     def get_cors_origins(self) -> List[str]:
         """
         Get list of allowed CORS origins.
@@ -62,17 +56,31 @@ class Settings(BaseSettings):
     # Timeouts and Retries
     llm_timeout_seconds: int = 60  # Per-LLM-call timeout (increased for concurrent calls)
     llm_max_retries: int = 3  # Used by tenacity retry decorator
+    # Overall budget for one guardrail LLM check, retries included; must exceed
+    # a primary timeout plus a fallback call so the fallback still gets to run
+    guardrail_llm_deadline_seconds: int = 150
+
+    # Exact-match LLM response cache (per process, 0 entries disables)
+    llm_cache_max_entries: int = 10000
+    llm_cache_ttl_seconds: int = 3600
+
+    # Health check - LLM providers are probed in the background, /health reads the cache
+    health_refresh_interval_seconds: int = 900
 
     # Logging
     log_level: str = "INFO"
+    log_format: str = "text"  # "text" or "json" (one JSON object per line, includes extra fields)
 
     # Rate Limiting (per-IP, per-minute)
     # Higher limits for internal service-to-service calls
+    # Disable when the service is only reachable from inside a trusted mesh
+    rate_limit_enabled: bool = True
     rate_limit_classify: str = "100/minute"
     rate_limit_generate: str = "100/minute"
     rate_limit_gates: str = "100/minute"
 
-    model_config = ConfigDict(env_file=".env", env_file_encoding="utf-8")
+    # Read once at startup; frozen so nothing can change config mid-process
+    model_config = ConfigDict(env_file=".env", env_file_encoding="utf-8", frozen=True)
 
 
 settings = Settings()
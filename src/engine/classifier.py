@@ -6,27 +6,50 @@ INSOLVENCY, DISPUTE, ALREADY_PAID, UNSUBSCRIBE, HOSTILE, PROMISE_TO_PAY,
 HARDSHIP, PLAN_REQUEST, REDIRECT, REQUEST_INFO, OUT_OF_OFFICE, COOPERATIVE, UNCLEAR
 """
 
-import json
+import asyncio
 import logging
+import re
 from datetime import date
+from typing import Dict, Tuple
 
 from pydantic import ValidationError
 
 from src.api.errors import LLMResponseInvalidError
 from src.api.models.requests import ClassifyRequest
 from src.api.models.responses import ClassifyResponse, ExtractedData, GuardrailValidation
+from src.config.settings import settings
 from src.guardrails.base import GuardrailSeverity
 from src.guardrails.pipeline import guardrail_pipeline
+from src.llm.cache import LLMResponseCache, normalize_prompt
 from src.llm.factory import llm_client
-from src.llm.schemas import ClassificationLLMResponse
+from src.llm.schemas import ClassificationLLMResponse, LLMExtractedData
 from src.prompts import CLASSIFY_EMAIL_SYSTEM, CLASSIFY_EMAIL_USER
 
 logger = logging.getLogger(__name__)
 
+# Lower temperature for classification
+CLASSIFY_TEMPERATURE = 0.2
+
+# Fields of LLMExtractedData, checked to decide whether anything was extracted
+_EXTRACTED_FIELDS = tuple(LLMExtractedData.model_fields)
+
+# Shape of the YYYY-MM-DD promise_date the prompt asks for; free text such as
+# "next Friday" is rejected here without raising from date.fromisoformat()
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 
 class EmailClassifier:
     """Classifies inbound emails from debtors."""
 
+    def __init__(self):
+        # Repeat emails (auto-replies, bounces, retries) skip the LLM call
+        self.response_cache = LLMResponseCache(
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+        )
+        # In-flight LLM calls by cache key, so concurrent identical emails share one call
+        self._inflight: Dict[str, asyncio.Future] = {}
+
     async def classify(self, request: ClassifyRequest) -> ClassifyResponse:
         """
         Classify an inbound email.
@@ -37,9 +60,16 @@ class EmailClassifier:
         Returns:
             Classification result with confidence, extracted data, and guardrail validation
         """
-        # Calculate derived values
-        total_outstanding = sum(o.amount_due for o in request.context.obligations)
-        days_overdue_max = max((o.days_past_due for o in request.context.obligations), default=0)
+        # Calculate derived values in a single pass over the obligations
+        # (days_past_due can be negative for invoices not yet due)
+        total_outstanding = 0.0
+        days_overdue_max = None
+        for obligation in request.context.obligations:
+            total_outstanding += obligation.amount_due
+            if days_overdue_max is None or obligation.days_past_due > days_overdue_max:
+                days_overdue_max = obligation.days_past_due
+        if days_overdue_max is None:
+            days_overdue_max = 0
 
         # Build industry context section
         industry_context = self._format_industry_context(request.context.industry)
@@ -64,46 +94,40 @@ class EmailClassifier:
             body=request.email.body,
         )
 
-        # Call LLM with lower temperature for classification
-        # Use response_schema for guaranteed valid JSON (no markdown wrapping)
-        response = await llm_client.complete(
-            system_prompt=CLASSIFY_EMAIL_SYSTEM,
-            user_prompt=user_prompt,
-            temperature=0.2,
-            response_schema=ClassificationLLMResponse,
+        # Key on the whitespace-normalized prompt so re-sent emails that differ
+        # only in line wrapping or spacing share one cache entry
+        cache_key = LLMResponseCache.make_key(
+            CLASSIFY_EMAIL_SYSTEM, normalize_prompt(user_prompt), CLASSIFY_TEMPERATURE
         )
-
-        # Parse JSON response - structured output guarantees valid JSON
-        tokens_used = response.usage.get("total_tokens", 0)
-        raw_result = json.loads(response.content)
-
-        # Validate LLM response using Pydantic schema
-        try:
-            result = ClassificationLLMResponse(**raw_result)
-        except ValidationError as e:
-            logger.error(f"LLM response validation failed: {e}")
-            raise LLMResponseInvalidError(
-                message="LLM returned invalid classification response",
-                details={"validation_errors": e.errors(), "raw_response": raw_result},
-            )
+        result = self.response_cache.get(cache_key)
+        if result is not None:
+            tokens_used = 0
+            logger.debug("Classification cache hit for %s", request.context.party.customer_code)
+        else:
+            result, tokens_used = await self._call_llm_coalesced(cache_key, user_prompt)
 
         # Parse extracted data
         extracted = None
         if result.extracted_data:
             extracted_raw = result.extracted_data
-            # Only create ExtractedData if there's actual data
-            if any(v is not None for v in extracted_raw.model_dump().values()):
+            # Only create ExtractedData if there's actual data (plain attribute
+            # reads; no model_dump() dict per classification)
+            if any(getattr(extracted_raw, f) is not None for f in _EXTRACTED_FIELDS):
                 # Parse promise_date string to date if present
                 promise_date_parsed = None
                 if extracted_raw.promise_date:
-                    try:
-                        promise_date_parsed = date.fromisoformat(extracted_raw.promise_date)
-                    except ValueError:
+                    if _ISO_DATE.fullmatch(extracted_raw.promise_date):
+                        try:
+                            promise_date_parsed = date.fromisoformat(extracted_raw.promise_date)
+                        except ValueError:
+                            # Right shape, impossible date (e.g. 2024-02-30)
+                            pass
+                    if promise_date_parsed is None:
                         logger.warning(
-                            f"Could not parse promise_date: {extracted_raw.promise_date}"
+                            "Could not parse promise_date: %s", extracted_raw.promise_date
                         )
 
-                extracted = ExtractedData(
+                extracted = ExtractedData.model_construct(
                     promise_date=promise_date_parsed,
                     promise_amount=extracted_raw.promise_amount,
                     dispute_type=extracted_raw.dispute_type,
@@ -133,7 +157,7 @@ class EmailClassifier:
                 if not r.passed and r.severity == GuardrailSeverity.MEDIUM
             ]
 
-            guardrail_validation = GuardrailValidation(
+            guardrail_validation = GuardrailValidation.model_construct(
                 all_passed=guardrail_result.all_passed,
                 guardrails_run=total_checks,
                 guardrails_passed=passed_checks,
@@ -144,16 +168,21 @@ class EmailClassifier:
 
             if not guardrail_result.all_passed:
                 logger.warning(
-                    f"Guardrails failed for {request.context.party.customer_code}: "
-                    f"blocking={guardrail_result.blocking_guardrails}, warnings={warnings}"
+                    "Guardrails failed for %s: blocking=%s, warnings=%s",
+                    request.context.party.customer_code,
+                    guardrail_result.blocking_guardrails,
+                    warnings,
                 )
 
         logger.info(
-            f"Classified email for {request.context.party.customer_code}: "
-            f"{result.classification} (confidence: {result.confidence:.2f})"
+            "Classified email for %s: %s (confidence: %.2f)",
+            request.context.party.customer_code,
+            result.classification,
+            result.confidence,
         )
 
-        return ClassifyResponse(
+        # Built from the schema-validated LLM response; skip re-validation
+        return ClassifyResponse.model_construct(
             classification=result.classification,
             confidence=result.confidence,
             reasoning=result.reasoning,
@@ -162,6 +191,61 @@ class EmailClassifier:
             guardrail_validation=guardrail_validation,
         )
 
+    async def _call_llm_coalesced(
+        self, cache_key: str, user_prompt: str
+    ) -> Tuple[ClassificationLLMResponse, int]:
+        """
+        Call the LLM, joining an identical call that is already in flight.
+
+        Bursts of the same email (webhook retries, duplicate deliveries) then
+        cost a single LLM round trip; callers that join report 0 tokens, the
+        same as a cache hit.
+        """
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            result, _ = await asyncio.shield(pending)
+            return result, 0
+
+        task = asyncio.ensure_future(self._call_llm(user_prompt))
+        self._inflight[cache_key] = task
+        # Cached from the task itself, so the result is kept even if the
+        # caller that started the call is cancelled before it finishes
+        task.add_done_callback(lambda done: self._finish_inflight(cache_key, done))
+
+        # Shielded so a cancelled caller doesn't cancel the call for joiners
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, cache_key: str, task: asyncio.Future) -> None:
+        """Drop a finished call from the in-flight map and cache its result."""
+        self._inflight.pop(cache_key, None)
+        if not task.cancelled() and task.exception() is None:
+            result, _ = task.result()
+            self.response_cache.set(cache_key, result)
+
+    async def _call_llm(self, user_prompt: str) -> Tuple[ClassificationLLMResponse, int]:
+        """Call the LLM and validate its classification response."""
+        # Use response_schema for guaranteed valid JSON (no markdown wrapping)
+        response = await llm_client.complete(
+            system_prompt=CLASSIFY_EMAIL_SYSTEM,
+            user_prompt=user_prompt,
+            temperature=CLASSIFY_TEMPERATURE,
+            response_schema=ClassificationLLMResponse,
+        )
+
+        tokens_used = response.usage.get("total_tokens", 0)
+
+        # Parse and validate the JSON in one pydantic-core pass
+        try:
+            result = ClassificationLLMResponse.model_validate_json(response.content)
+        except ValidationError as e:
+            logger.error("LLM response validation failed: %s", e)
+            raise LLMResponseInvalidError(
+                message="LLM returned invalid classification response",
+                details={"validation_errors": e.errors(), "raw_response": response.content},
+            )
+
+        return result, tokens_used
+
     def _format_industry_context(self, industry) -> str:
         """Format industry context for prompt inclusion."""
         if not industry:
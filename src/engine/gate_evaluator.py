@@ -17,7 +17,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
-from src.api.models.requests import EvaluateGatesRequest
+from src.api.models.requests import CaseContext, EvaluateGatesRequest
 from src.api.models.responses import EvaluateGatesResponse, GateResult
 
 logger = logging.getLogger(__name__)
@@ -45,13 +45,41 @@ class GateEvaluator:
         Returns:
             Gate evaluation results with pass/fail for each gate
         """
-        comm = request.context.communication
-        context = request.context
+        return self.evaluate_context(
+            request.context, request.proposed_action, request.proposed_tone
+        )
+
+    def evaluate_context(
+        self,
+        context: CaseContext,
+        proposed_action: str,
+        proposed_tone: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> EvaluateGatesResponse:
+        """
+        Evaluate gates for an already-validated context (synchronous).
+
+        Gate evaluation never awaits, so batch callers can use this directly
+        instead of scheduling one coroutine per context.
+
+        Args:
+            context: Case context to evaluate
+            proposed_action: Action being proposed (send_email, escalate, ...)
+            proposed_tone: Optional tone for the escalation gate
+            now: Evaluation time (UTC); batch callers pass one value for all
+                contexts. Defaults to the current time.
+
+        Returns:
+            Gate evaluation results with pass/fail for each gate
+        """
+        comm = context.communication
+        if now is None:
+            now = datetime.now(timezone.utc)
 
         # Calculate days since last touch
         days_since_last_touch = 999  # Default to large number if never contacted
         if comm and comm.last_touch_at:
-            delta = datetime.now(timezone.utc) - comm.last_touch_at
+            delta = now - comm.last_touch_at
             days_since_last_touch = delta.days
 
         # Check do_not_contact_until date
@@ -61,9 +89,11 @@ class GateEvaluator:
                 hold_date = datetime.fromisoformat(context.do_not_contact_until)
                 if hold_date.tzinfo is None:
                     hold_date = hold_date.replace(tzinfo=timezone.utc)
-                do_not_contact_active = datetime.now(timezone.utc).date() < hold_date.date()
+                do_not_contact_active = now.date() < hold_date.date()
             except ValueError:
-                logger.warning(f"Invalid do_not_contact_until date: {context.do_not_contact_until}")
+                logger.warning(
+                    "Invalid do_not_contact_until date: %s", context.do_not_contact_until
+                )
 
         # Evaluate each gate
         gate_results = {}
@@ -100,7 +130,7 @@ class GateEvaluator:
 
         # 6. Escalation Appropriate Gate
         gate_results["escalation_appropriate"] = self._evaluate_escalation(
-            proposed_tone=request.proposed_tone,
+            proposed_tone=proposed_tone,
             last_tone_used=comm.last_tone_used if comm else None,
             touch_count=comm.touch_count if comm else 0,
             broken_promises_count=context.broken_promises_count,
@@ -116,13 +146,19 @@ class GateEvaluator:
         if not all_passed:
             recommended_action = self._get_recommended_action(gate_results)
 
-        logger.info(
-            f"Evaluated gates for {context.party.customer_code}: "
-            f"action={request.proposed_action}, allowed={all_passed}, "
-            f"failed_gates={[k for k, v in gate_results.items() if not v.passed]}"
-        )
+        # Guarded: building failed_gates is only needed for the log line
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Evaluated gates for %s: action=%s, allowed=%s, failed_gates=%s",
+                context.party.customer_code,
+                proposed_action,
+                all_passed,
+                [k for k, v in gate_results.items() if not v.passed],
+            )
 
-        return EvaluateGatesResponse(
+        # Every value above is computed here from the validated context, so
+        # skip re-validation of the response and its gate results
+        return EvaluateGatesResponse.model_construct(
             allowed=all_passed,
             gate_results=gate_results,
             recommended_action=recommended_action,
@@ -132,7 +168,7 @@ class GateEvaluator:
     def _evaluate_touch_cap(self, monthly_count: int, cap: int) -> GateResult:
         """Check if monthly touch cap has been reached."""
         passed = monthly_count < cap
-        return GateResult(
+        return GateResult.model_construct(
             passed=passed,
             reason=f"Monthly touches ({monthly_count}) {'below' if passed else 'at or exceeds'} cap ({cap})",
             current_value=monthly_count,
@@ -149,7 +185,7 @@ class GateEvaluator:
         """Check if cooling off period has elapsed."""
         # Do not contact hold takes precedence
         if do_not_contact_active:
-            return GateResult(
+            return GateResult.model_construct(
                 passed=False,
                 reason=f"Do not contact until {do_not_contact_until}",
                 current_value=0,
@@ -157,7 +193,7 @@ class GateEvaluator:
             )
 
         passed = days_since_last >= interval_days
-        return GateResult(
+        return GateResult.model_construct(
             passed=passed,
             reason=f"Days since last touch ({days_since_last}) {'meets' if passed else 'below'} minimum interval ({interval_days})",
             current_value=days_since_last,
@@ -167,7 +203,7 @@ class GateEvaluator:
     def _evaluate_dispute(self, active_dispute: bool) -> GateResult:
         """Check if there's an active dispute blocking contact."""
         passed = not active_dispute
-        return GateResult(
+        return GateResult.model_construct(
             passed=passed,
             reason="No active dispute" if passed else "Active dispute - contact blocked",
             current_value=active_dispute,
@@ -179,13 +215,13 @@ class GateEvaluator:
         # Hardship doesn't block, but flags for special handling
         # For now, we pass but include warning in reason
         if hardship_indicated:
-            return GateResult(
+            return GateResult.model_construct(
                 passed=True,  # Allow but with special handling
                 reason="Hardship indicated - use sensitive tone",
                 current_value=hardship_indicated,
                 threshold=None,
             )
-        return GateResult(
+        return GateResult.model_construct(
             passed=True,
             reason="No hardship indicated",
             current_value=hardship_indicated,
@@ -195,7 +231,7 @@ class GateEvaluator:
     def _evaluate_unsubscribe(self, unsubscribe_requested: bool) -> GateResult:
         """Check if party has requested to unsubscribe."""
         passed = not unsubscribe_requested
-        return GateResult(
+        return GateResult.model_construct(
             passed=passed,
             reason="No unsubscribe request"
             if passed
@@ -231,7 +267,7 @@ class GateEvaluator:
         if industry and hasattr(industry, "escalation_patience"):
             escalation_patience = industry.escalation_patience
         if not proposed_tone:
-            return GateResult(
+            return GateResult.model_construct(
                 passed=True,
                 reason="No specific tone proposed",
                 current_value=None,
@@ -254,7 +290,7 @@ class GateEvaluator:
 
         # Unknown tone - allow
         if proposed_idx == -1:
-            return GateResult(
+            return GateResult.model_construct(
                 passed=True,
                 reason=f"Tone '{proposed_tone}' not in standard escalation path",
                 current_value=proposed_tone,
@@ -265,13 +301,13 @@ class GateEvaluator:
         if touch_count == 0 or last_idx == -1:
             # Can't start with firm or final_notice
             if proposed_idx >= 3:  # firm or final_notice
-                return GateResult(
+                return GateResult.model_construct(
                     passed=False,
                     reason=f"Cannot start with '{proposed_tone}' on first contact",
                     current_value=proposed_tone,
                     threshold="friendly_reminder or professional",
                 )
-            return GateResult(
+            return GateResult.model_construct(
                 passed=True,
                 reason=f"'{proposed_tone}' appropriate for first contact",
                 current_value=proposed_tone,
@@ -283,7 +319,7 @@ class GateEvaluator:
 
         # Allow same or lower tone (de-escalation is fine)
         if jump <= 0:
-            return GateResult(
+            return GateResult.model_construct(
                 passed=True,
                 reason=f"Tone '{proposed_tone}' same or lower than last '{last_tone_used}'",
                 current_value=proposed_tone,
@@ -304,7 +340,7 @@ class GateEvaluator:
         # Allow escalation within limits
         if jump <= max_jump:
             if jump == 1:
-                return GateResult(
+                return GateResult.model_construct(
                     passed=True,
                     reason=f"Single-step escalation from '{last_tone_used}' to '{proposed_tone}'",
                     current_value=proposed_tone,
@@ -316,7 +352,7 @@ class GateEvaluator:
                     reason_suffix = f" (industry={escalation_patience})"
                 elif broken_promises_count > 0:
                     reason_suffix = f" (justified by {broken_promises_count} broken promises)"
-                return GateResult(
+                return GateResult.model_construct(
                     passed=True,
                     reason=f"Double-step escalation from '{last_tone_used}' to '{proposed_tone}'{reason_suffix}",
                     current_value=proposed_tone,
@@ -330,7 +366,7 @@ class GateEvaluator:
             else "N/A"
         )
         patience_hint = f" (industry patience: {escalation_patience})" if industry else ""
-        return GateResult(
+        return GateResult.model_construct(
             passed=False,
             reason=f"Escalation from '{last_tone_used}' to '{proposed_tone}' too aggressive (jump of {jump} levels){patience_hint}",
             current_value=proposed_tone,
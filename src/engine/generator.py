@@ -4,22 +4,27 @@ Draft generation engine.
 Generates collection email drafts with 5 tones based on ai_logic.md:
 friendly_reminder, professional, firm, final_notice, concerned_inquiry
 
-Includes guardrail retry mechanism: if guardrails fail, the generator
+Includes guardrail retry mechanism: if a blocking guardrail fails, the generator
 will retry with feedback about what went wrong, giving the LLM a chance
 to correct its output.
 """
 
-import json
+import asyncio
+import heapq
 import logging
 import time
+from datetime import datetime, timezone
+from typing import List, Sequence, Union
 
 from pydantic import ValidationError
 
 from src.api.errors import LLMResponseInvalidError
 from src.api.models.requests import GenerateDraftRequest
 from src.api.models.responses import GenerateDraftResponse, GuardrailValidation
+from src.config.settings import settings
 from src.guardrails.base import GuardrailPipelineResult, GuardrailSeverity
 from src.guardrails.pipeline import guardrail_pipeline
+from src.llm.cache import LLMResponseCache
 from src.llm.factory import llm_client
 from src.llm.schemas import DraftGenerationLLMResponse
 from src.prompts import GENERATE_DRAFT_SYSTEM, GENERATE_DRAFT_USER
@@ -29,10 +34,23 @@ logger = logging.getLogger(__name__)
 # Maximum retries when guardrails fail
 MAX_GUARDRAIL_RETRIES = 2
 
+# Higher temperature for creative generation
+DRAFT_TEMPERATURE = 0.7
+
+# Default cap on concurrent LLM calls for bulk generation
+MAX_CONCURRENT_DRAFTS = 10
+
 
 class DraftGenerator:
     """Generates collection email drafts with guardrail retry mechanism."""
 
+    def __init__(self):
+        # Bulk re-runs over unchanged cases get the previous draft back
+        self.response_cache = LLMResponseCache(
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+        )
+
     async def generate(self, request: GenerateDraftRequest) -> GenerateDraftResponse:
         """
         Generate a collection email draft with automatic retry on guardrail failures.
@@ -43,17 +61,18 @@ class DraftGenerator:
         Returns:
             Generated draft with subject, body, and guardrail validation
 
-        The generator will retry up to MAX_GUARDRAIL_RETRIES times if guardrails
-        fail, passing the failure reasons back to the LLM to help it correct
+        The generator will retry up to MAX_GUARDRAIL_RETRIES times if blocking
+        guardrails fail, passing the failure reasons back to the LLM to help it correct
         the output.
         """
         # Calculate derived values
         total_outstanding = sum(o.amount_due for o in request.context.obligations)
 
-        # Build invoices list (top 10 by days overdue)
-        sorted_obligations = sorted(
-            request.context.obligations, key=lambda o: o.days_past_due, reverse=True
-        )[:10]
+        # Build invoices list (top 10 by days overdue); nlargest keeps the same
+        # order as a full descending sort without sorting every obligation
+        sorted_obligations = heapq.nlargest(
+            10, request.context.obligations, key=lambda o: o.days_past_due
+        )
 
         invoices_list = (
             "\n".join(
@@ -73,8 +92,6 @@ class DraftGenerator:
         # Calculate days since last touch
         days_since_last_touch = request.context.days_in_state or 0
         if comm and comm.last_touch_at:
-            from datetime import datetime, timezone
-
             delta = datetime.now(timezone.utc) - comm.last_touch_at
             days_since_last_touch = delta.days
 
@@ -119,6 +136,16 @@ class DraftGenerator:
             else "",
         )
 
+        # The prompt carries every input that shapes the draft, so an identical
+        # prompt can reuse a draft that already passed guardrails
+        cache_key = LLMResponseCache.make_key(
+            GENERATE_DRAFT_SYSTEM, base_user_prompt, DRAFT_TEMPERATURE
+        )
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Draft cache hit for %s", request.context.party.customer_code)
+            return cached.model_copy(update={"tokens_used": 0})
+
         # Retry loop for guardrail failures
         guardrail_feedback = None
         total_tokens_used = 0
@@ -134,7 +161,7 @@ class DraftGenerator:
             if guardrail_feedback:
                 user_prompt += guardrail_feedback
                 logger.info(
-                    f"Retrying draft generation (attempt {attempt + 1}) with guardrail feedback"
+                    "Retrying draft generation (attempt %d) with guardrail feedback", attempt + 1
                 )
 
             # Call LLM with higher temperature for creative generation
@@ -143,7 +170,7 @@ class DraftGenerator:
             response = await llm_client.complete(
                 system_prompt=GENERATE_DRAFT_SYSTEM,
                 user_prompt=user_prompt,
-                temperature=0.7,
+                temperature=DRAFT_TEMPERATURE,
                 response_schema=DraftGenerationLLMResponse,
             )
             llm_latencies.append((time.perf_counter() - llm_start) * 1000)
@@ -151,17 +178,14 @@ class DraftGenerator:
             # Track total tokens across retries
             total_tokens_used += response.usage.get("total_tokens", 0)
 
-            # Parse JSON response - structured output guarantees valid JSON
-            raw_result = json.loads(response.content)
-
-            # Validate LLM response using Pydantic schema
+            # Parse and validate the JSON in one pydantic-core pass
             try:
-                result = DraftGenerationLLMResponse(**raw_result)
+                result = DraftGenerationLLMResponse.model_validate_json(response.content)
             except ValidationError as e:
-                logger.error(f"LLM response validation failed: {e}")
+                logger.error("LLM response validation failed: %s", e)
                 raise LLMResponseInvalidError(
                     message="LLM returned invalid draft generation response",
-                    details={"validation_errors": e.errors(), "raw_response": raw_result},
+                    details={"validation_errors": e.errors(), "raw_response": response.content},
                 )
 
             # Run guardrails on generated draft body (critical for factual accuracy)
@@ -172,20 +196,33 @@ class DraftGenerator:
             )
             guardrail_latencies.append((time.perf_counter() - guardrail_start) * 1000)
 
-            # If all guardrails passed, we're done
-            if guardrail_result.all_passed:
+            # Done unless a guardrail blocks; warning-level failures are
+            # reported in the response but don't justify another LLM call
+            if not guardrail_result.blocking_guardrails:
                 if attempt > 0:
                     logger.info(
-                        f"Guardrails passed on retry attempt {attempt + 1} for "
-                        f"{request.context.party.customer_code}"
+                        "Guardrails passed on retry attempt %d for %s",
+                        attempt + 1,
+                        request.context.party.customer_code,
+                    )
+                if not guardrail_result.all_passed:
+                    logger.info(
+                        "Accepted draft with guardrail warnings only",
+                        extra={
+                            "metric_type": "warnings_only_accepted",
+                            "customer_code": request.context.party.customer_code,
+                            "attempt": attempt + 1,
+                        },
                     )
                 break
 
             # If this was the last attempt, exit loop with failed guardrails
             if attempt >= MAX_GUARDRAIL_RETRIES:
                 logger.warning(
-                    f"Guardrails still failing after {MAX_GUARDRAIL_RETRIES + 1} attempts for "
-                    f"{request.context.party.customer_code}: {guardrail_result.blocking_guardrails}"
+                    "Guardrails still failing after %d attempts for %s: %s",
+                    MAX_GUARDRAIL_RETRIES + 1,
+                    request.context.party.customer_code,
+                    guardrail_result.blocking_guardrails,
                 )
                 break
 
@@ -209,7 +246,7 @@ class DraftGenerator:
             if not r.passed and r.severity == GuardrailSeverity.MEDIUM
         ]
 
-        guardrail_validation = GuardrailValidation(
+        guardrail_validation = GuardrailValidation.model_construct(
             all_passed=guardrail_result.all_passed,
             guardrails_run=total_checks,
             guardrails_passed=passed_checks,
@@ -220,8 +257,10 @@ class DraftGenerator:
 
         if not guardrail_result.all_passed:
             logger.warning(
-                f"Guardrails failed for draft {request.context.party.customer_code}: "
-                f"blocking={guardrail_result.blocking_guardrails}, warnings={warnings}"
+                "Guardrails failed for draft %s: blocking=%s, warnings=%s",
+                request.context.party.customer_code,
+                guardrail_result.blocking_guardrails,
+                warnings,
             )
 
         # Calculate end-to-end timing
@@ -245,7 +284,8 @@ class DraftGenerator:
             },
         )
 
-        return GenerateDraftResponse(
+        # Built from the schema-validated LLM response; skip re-validation
+        draft = GenerateDraftResponse.model_construct(
             subject=result.subject,
             body=result.body,
             tone_used=request.tone,
@@ -253,6 +293,40 @@ class DraftGenerator:
             tokens_used=total_tokens_used,
             guardrail_validation=guardrail_validation,
         )
+        # Only cache drafts that are safe to send again
+        if guardrail_result.all_passed:
+            self.response_cache.set(cache_key, draft)
+        return draft
+
+    async def generate_many(
+        self,
+        requests: Sequence[GenerateDraftRequest],
+        max_concurrency: int = MAX_CONCURRENT_DRAFTS,
+    ) -> List[Union[GenerateDraftResponse, Exception]]:
+        """
+        Generate drafts for many requests concurrently.
+
+        At most max_concurrency generations are in flight at once, keeping
+        bulk runs under the provider's rate limit while still overlapping
+        LLM round trips.
+
+        Args:
+            requests: Generation requests
+            max_concurrency: Maximum generations in flight at once
+
+        Returns:
+            One entry per request, in order: the draft, or the exception that
+            request raised (a failure doesn't abort the rest of the batch)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _generate_one(request: GenerateDraftRequest) -> GenerateDraftResponse:
+            async with semaphore:
+                return await self.generate(request)
+
+        return await asyncio.gather(
+            *(_generate_one(request) for request in requests), return_exceptions=True
+        )
 
     def _format_industry_context(self, industry) -> str:
         """Format industry context for prompt inclusion."""
@@ -274,8 +348,6 @@ class DraftGenerator:
 
         if industry.seasonal_patterns:
             # Get current quarter
-            from datetime import datetime
-
             quarter = f"Q{(datetime.now().month - 1) // 3 + 1}"
             if quarter in industry.seasonal_patterns:
                 lines.append(f"- Current Season ({quarter}): {industry.seasonal_patterns[quarter]}")
@@ -36,7 +36,7 @@ class EvalMetric(Enum):
     HUMAN_OVERRIDE_RATE = "human_override_rate"
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractionMetrics:
     """Metrics for a single AI interaction (classification or generation)."""
 
@@ -92,7 +92,7 @@ class InteractionMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationMetrics:
     """Metrics for a conversation/case over time."""
 
@@ -168,7 +168,7 @@ class ConversationMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioMetrics:
     """Aggregate metrics across all cases/conversations."""
 
@@ -1,8 +1,7 @@
 """Real-time evaluator for per-request evaluation."""
 
 import logging
-import uuid
-from datetime import datetime
+import os
 from typing import Any, Optional
 
 from src.api.models.requests import ClassifyRequest, GenerateDraftRequest
@@ -35,6 +34,14 @@ class RealTimeEvaluator:
         self.store = store
         self._metrics_buffer: list[InteractionMetrics] = []
         self._buffer_size = 100  # Flush after this many metrics
+        self._reset_totals()
+
+    def _reset_totals(self) -> None:
+        """Reset the running totals kept alongside the buffer for summary stats."""
+        self._passed_total = 0
+        self._accuracy_total = 0.0
+        self._latency_total = 0.0
+        self._tokens_total = 0
 
     def evaluate_classification(
         self,
@@ -59,22 +66,12 @@ class RealTimeEvaluator:
         Returns:
             InteractionMetrics with evaluation results
         """
-        request_id = str(uuid.uuid4())
+        request_id = os.urandom(16).hex()
 
         # Calculate factual accuracy from guardrails
-        guardrails_passed = True
-        guardrail_failures = []
-        factual_accuracy = 1.0
-
-        if guardrail_result:
-            guardrails_passed = guardrail_result.all_passed
-            guardrail_failures = [
-                r.guardrail_name for r in guardrail_result.results if not r.passed
-            ]
-            # Accuracy = passed / total checks
-            total_checks = len(guardrail_result.results)
-            passed_checks = sum(1 for r in guardrail_result.results if r.passed)
-            factual_accuracy = passed_checks / total_checks if total_checks > 0 else 1.0
+        guardrails_passed, guardrail_failures, factual_accuracy = self._compute_guardrail_stats(
+            guardrail_result
+        )
 
         # Extract promise/dispute data if present
         extracted = response.extracted_data
@@ -90,7 +87,6 @@ class RealTimeEvaluator:
 
         metrics = InteractionMetrics(
             request_id=request_id,
-            timestamp=datetime.utcnow(),
             guardrails_passed=guardrails_passed,
             guardrail_failures=guardrail_failures,
             factual_accuracy=factual_accuracy,
@@ -136,25 +132,15 @@ class RealTimeEvaluator:
         Returns:
             InteractionMetrics with evaluation results
         """
-        request_id = str(uuid.uuid4())
+        request_id = os.urandom(16).hex()
 
         # Calculate factual accuracy from guardrails
-        guardrails_passed = True
-        guardrail_failures = []
-        factual_accuracy = 1.0
-
-        if guardrail_result:
-            guardrails_passed = guardrail_result.all_passed
-            guardrail_failures = [
-                r.guardrail_name for r in guardrail_result.results if not r.passed
-            ]
-            total_checks = len(guardrail_result.results)
-            passed_checks = sum(1 for r in guardrail_result.results if r.passed)
-            factual_accuracy = passed_checks / total_checks if total_checks > 0 else 1.0
+        guardrails_passed, guardrail_failures, factual_accuracy = self._compute_guardrail_stats(
+            guardrail_result
+        )
 
         metrics = InteractionMetrics(
             request_id=request_id,
-            timestamp=datetime.utcnow(),
             guardrails_passed=guardrails_passed,
             guardrail_failures=guardrail_failures,
             factual_accuracy=factual_accuracy,
@@ -173,29 +159,66 @@ class RealTimeEvaluator:
 
         return metrics
 
+    def _compute_guardrail_stats(
+        self, guardrail_result: Optional[GuardrailPipelineResult]
+    ) -> tuple[bool, list[str], float]:
+        """
+        Summarize guardrail results for metrics.
+
+        Returns:
+            (all passed, names of failed guardrails, factual accuracy), where
+            accuracy is passed checks / total checks. No result counts as a pass.
+        """
+        if not guardrail_result:
+            return True, [], 1.0
+
+        # Collect failures and count passes in one pass over the results
+        guardrail_failures = []
+        passed_checks = 0
+        for r in guardrail_result.results:
+            if r.passed:
+                passed_checks += 1
+            else:
+                guardrail_failures.append(r.guardrail_name)
+        total_checks = len(guardrail_result.results)
+        factual_accuracy = passed_checks / total_checks if total_checks > 0 else 1.0
+        return guardrail_result.all_passed, guardrail_failures, factual_accuracy
+
     def _log_metrics(self, metrics: InteractionMetrics) -> None:
         """Log metrics for monitoring."""
-        log_data = {
-            "request_id": metrics.request_id,
-            "guardrails_passed": metrics.guardrails_passed,
-            "factual_accuracy": f"{metrics.factual_accuracy:.2%}",
-            "classification": metrics.classification,
-            "confidence": f"{metrics.classification_confidence:.2f}",
-            "latency_ms": f"{metrics.latency_ms:.0f}",
-            "tokens": metrics.tokens_used,
-        }
-
         if metrics.guardrails_passed:
-            logger.info(f"Eval metrics: {log_data}")
+            # Guarded: skip building the argument tuple when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Eval metrics: request_id=%s, factual_accuracy=%.2f%%, "
+                    "classification=%s, confidence=%.2f, latency_ms=%.0f, tokens=%d",
+                    metrics.request_id,
+                    metrics.factual_accuracy * 100,
+                    metrics.classification,
+                    metrics.classification_confidence,
+                    metrics.latency_ms,
+                    metrics.tokens_used,
+                )
         else:
             logger.warning(
-                f"Eval metrics (guardrails failed): {log_data}, "
-                f"failures={metrics.guardrail_failures}"
+                "Eval metrics (guardrails failed): request_id=%s, factual_accuracy=%.2f%%, "
+                "classification=%s, confidence=%.2f, latency_ms=%.0f, tokens=%d, failures=%s",
+                metrics.request_id,
+                metrics.factual_accuracy * 100,
+                metrics.classification,
+                metrics.classification_confidence,
+                metrics.latency_ms,
+                metrics.tokens_used,
+                metrics.guardrail_failures,
             )
 
     def _buffer_metrics(self, metrics: InteractionMetrics) -> None:
         """Buffer metrics for batch storage."""
         self._metrics_buffer.append(metrics)
+        self._passed_total += metrics.guardrails_passed
+        self._accuracy_total += metrics.factual_accuracy
+        self._latency_total += metrics.latency_ms
+        self._tokens_total += metrics.tokens_used
 
         if len(self._metrics_buffer) >= self._buffer_size:
             self._flush_buffer()
@@ -209,29 +232,27 @@ class RealTimeEvaluator:
             try:
                 # Store would implement bulk insert
                 # self.store.bulk_insert(self._metrics_buffer)
-                logger.info(f"Flushed {len(self._metrics_buffer)} metrics to storage")
+                logger.info("Flushed %d metrics to storage", len(self._metrics_buffer))
             except Exception as e:
-                logger.error(f"Failed to flush metrics: {e}")
+                logger.error("Failed to flush metrics: %s", e)
 
         self._metrics_buffer = []
+        self._reset_totals()
 
     def get_summary_stats(self) -> dict:
         """Get summary statistics from buffered metrics."""
         if not self._metrics_buffer:
             return {}
 
+        # Totals are accumulated as metrics are buffered, so this is O(1)
         total = len(self._metrics_buffer)
-        passed = sum(1 for m in self._metrics_buffer if m.guardrails_passed)
-        avg_accuracy = sum(m.factual_accuracy for m in self._metrics_buffer) / total
-        avg_latency = sum(m.latency_ms for m in self._metrics_buffer) / total
-        avg_tokens = sum(m.tokens_used for m in self._metrics_buffer) / total
 
         return {
             "total_requests": total,
-            "guardrail_pass_rate": passed / total,
-            "avg_factual_accuracy": avg_accuracy,
-            "avg_latency_ms": avg_latency,
-            "avg_tokens_used": avg_tokens,
+            "guardrail_pass_rate": self._passed_total / total,
+            "avg_factual_accuracy": self._accuracy_total / total,
+            "avg_latency_ms": self._latency_total / total,
+            "avg_tokens_used": self._tokens_total / total,
         }
 
 
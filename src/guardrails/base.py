@@ -18,7 +18,12 @@ class GuardrailSeverity(Enum):
     LOW = "low"  # Log only, allow
 
 
-@dataclass
+# Severities whose failures block the output. A module-level tuple: membership
+# checks hit the identity fast path and build no list per call.
+_BLOCKING_SEVERITIES = (GuardrailSeverity.CRITICAL, GuardrailSeverity.HIGH)
+
+
+@dataclass(slots=True)
 class GuardrailResult:
     """Result of a guardrail validation check."""
 
@@ -34,10 +39,7 @@ class GuardrailResult:
     @property
     def should_block(self) -> bool:
         """Whether this failure should block the output."""
-        return not self.passed and self.severity in [
-            GuardrailSeverity.CRITICAL,
-            GuardrailSeverity.HIGH,
-        ]
+        return not self.passed and self.severity in _BLOCKING_SEVERITIES
 
     def to_dict(self) -> dict:
         """Convert to dictionary for logging/API responses."""
@@ -52,7 +54,7 @@ class GuardrailResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GuardrailPipelineResult:
     """Result of running all guardrails in the pipeline."""
 
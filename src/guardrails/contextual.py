@@ -8,6 +8,71 @@ from .base import BaseGuardrail, GuardrailResult, GuardrailSeverity
 
 logger = logging.getLogger(__name__)
 
+# Phrase lists are matched against the lowercased output. Built once at import
+# rather than on every validate() call.
+
+# Phrases that suggest payment demand (inappropriate during dispute)
+DEMAND_PHRASES = (
+    "pay immediately",
+    "pay now",
+    "immediate payment",
+    "pay in full",
+    "demand payment",
+    "must pay",
+    "required to pay",
+    "failure to pay will result",
+    "legal action",
+    "collection agency",
+)
+
+# Phrases that acknowledge dispute (appropriate)
+DISPUTE_PHRASES = (
+    "dispute",
+    "under review",
+    "investigating",
+    "looking into",
+    "resolve",
+    "concern",
+    "issue",
+)
+
+# Harsh/demanding phrases (inappropriate for hardship)
+HARSH_PHRASES = (
+    "failure to pay",
+    "will be forced",
+    "no choice but",
+    "legal consequences",
+    "must pay immediately",
+    "demand",
+    "threaten",
+)
+
+# Empathetic phrases (appropriate for hardship)
+EMPATHETIC_PHRASES = (
+    "understand",
+    "difficult",
+    "challenging",
+    "work with you",
+    "payment plan",
+    "options",
+    "help",
+    "support",
+    "flexibility",
+    "circumstances",
+)
+
+# Phrases that acknowledge a history of broken promises
+HISTORY_PHRASES = (
+    "previous",
+    "history",
+    "past",
+    "again",
+    "before",
+    "commitment",
+    "promise",
+    "assured",
+)
+
 
 class ContextualCoherenceGuardrail(BaseGuardrail):
     """
@@ -29,18 +94,20 @@ class ContextualCoherenceGuardrail(BaseGuardrail):
     def validate(self, output: str, context: CaseContext, **kwargs) -> list[GuardrailResult]:
         """Validate contextual coherence of the output."""
         results = []
+        # Lowercase once; every phrase check below matches against this
+        output_lower = output.lower()
 
         # Check dispute handling
         if context.active_dispute:
-            results.append(self._validate_dispute_awareness(output, context))
+            results.append(self._validate_dispute_awareness(output_lower, context))
 
         # Check hardship handling
         if context.hardship_indicated:
-            results.append(self._validate_hardship_tone(output, context))
+            results.append(self._validate_hardship_tone(output_lower, context))
 
         # Check broken promise awareness
         if context.broken_promises_count > 0:
-            results.append(self._validate_promise_awareness(output, context))
+            results.append(self._validate_promise_awareness(output_lower, context))
 
         # If no special conditions, just pass
         if not results:
@@ -48,38 +115,13 @@ class ContextualCoherenceGuardrail(BaseGuardrail):
 
         return results
 
-    def _validate_dispute_awareness(self, output: str, context: CaseContext) -> GuardrailResult:
+    def _validate_dispute_awareness(
+        self, output_lower: str, context: CaseContext
+    ) -> GuardrailResult:
         """Validate that output respects active dispute status."""
-        output_lower = output.lower()
-
-        # Phrases that suggest payment demand (inappropriate during dispute)
-        demand_phrases = [
-            "pay immediately",
-            "pay now",
-            "immediate payment",
-            "pay in full",
-            "demand payment",
-            "must pay",
-            "required to pay",
-            "failure to pay will result",
-            "legal action",
-            "collection agency",
-        ]
-
-        # Phrases that acknowledge dispute (appropriate)
-        dispute_phrases = [
-            "dispute",
-            "under review",
-            "investigating",
-            "looking into",
-            "resolve",
-            "concern",
-            "issue",
-        ]
-
         # Check for inappropriate demand language
-        found_demands = [phrase for phrase in demand_phrases if phrase in output_lower]
-        acknowledges_dispute = any(phrase in output_lower for phrase in dispute_phrases)
+        found_demands = [phrase for phrase in DEMAND_PHRASES if phrase in output_lower]
+        acknowledges_dispute = any(phrase in output_lower for phrase in DISPUTE_PHRASES)
 
         if found_demands and not acknowledges_dispute:
             return self._fail(
@@ -106,37 +148,10 @@ class ContextualCoherenceGuardrail(BaseGuardrail):
             details={"dispute_acknowledged": acknowledges_dispute},
         )
 
-    def _validate_hardship_tone(self, output: str, context: CaseContext) -> GuardrailResult:
+    def _validate_hardship_tone(self, output_lower: str, context: CaseContext) -> GuardrailResult:
         """Validate that output uses appropriate tone for hardship cases."""
-        output_lower = output.lower()
-
-        # Harsh/demanding phrases (inappropriate for hardship)
-        harsh_phrases = [
-            "failure to pay",
-            "will be forced",
-            "no choice but",
-            "legal consequences",
-            "must pay immediately",
-            "demand",
-            "threaten",
-        ]
-
-        # Empathetic phrases (appropriate for hardship)
-        empathetic_phrases = [
-            "understand",
-            "difficult",
-            "challenging",
-            "work with you",
-            "payment plan",
-            "options",
-            "help",
-            "support",
-            "flexibility",
-            "circumstances",
-        ]
-
-        found_harsh = [phrase for phrase in harsh_phrases if phrase in output_lower]
-        found_empathetic = [phrase for phrase in empathetic_phrases if phrase in output_lower]
+        found_harsh = [phrase for phrase in HARSH_PHRASES if phrase in output_lower]
+        found_empathetic = [phrase for phrase in EMPATHETIC_PHRASES if phrase in output_lower]
 
         # Fail if harsh without empathy
         if found_harsh and not found_empathetic:
@@ -165,24 +180,13 @@ class ContextualCoherenceGuardrail(BaseGuardrail):
             details={"empathetic_phrases": found_empathetic},
         )
 
-    def _validate_promise_awareness(self, output: str, context: CaseContext) -> GuardrailResult:
+    def _validate_promise_awareness(
+        self, output_lower: str, context: CaseContext
+    ) -> GuardrailResult:
         """Validate awareness of broken promises history."""
-        output_lower = output.lower()
-
         # If multiple broken promises, output should acknowledge history
         if context.broken_promises_count >= 2:
-            history_phrases = [
-                "previous",
-                "history",
-                "past",
-                "again",
-                "before",
-                "commitment",
-                "promise",
-                "assured",
-            ]
-
-            acknowledges_history = any(phrase in output_lower for phrase in history_phrases)
+            acknowledges_history = any(phrase in output_lower for phrase in HISTORY_PHRASES)
 
             if not acknowledges_history:
                 # This is a medium severity - just warn
@@ -1,15 +1,18 @@
 """Entity Verification Guardrail - LLM-based validation of customer/party identifiers."""
 
 import asyncio
-import json
+import atexit
 import logging
 import re
-import time
+import threading
 from typing import Any, List
 
-from pydantic import BaseModel, Field
+from langchain_core.exceptions import OutputParserException
+from pydantic import BaseModel, Field, ValidationError
 
 from src.api.models.requests import CaseContext
+from src.config.settings import settings
+from src.llm.cache import LLMResponseCache
 from src.llm.factory import llm_client
 
 from .base import BaseGuardrail, GuardrailResult, GuardrailSeverity
@@ -20,6 +23,48 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 3
 INITIAL_BACKOFF_SECONDS = 1.0
 
+# A response that doesn't match EntityValidationResult at temperature 0 will
+# come back the same way, so schema mismatches fail without a retry. Providers
+# raise OutputParserException when their structured-output parsing fails;
+# ValidationError covers content that parses but doesn't fit the schema.
+_NON_RETRYABLE_ERRORS = (OutputParserException, ValidationError)
+
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+# One event loop per guardrail worker thread, reused across validations
+# instead of building and tearing down a loop for every LLM call
+_loop_tls = threading.local()
+_thread_loops: list[asyncio.AbstractEventLoop] = []
+_thread_loops_lock = threading.Lock()
+
+
+def _get_thread_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's event loop, creating it on first use."""
+    loop = getattr(_loop_tls, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _loop_tls.loop = loop
+        with _thread_loops_lock:
+            _thread_loops.append(loop)
+    asyncio.set_event_loop(loop)
+    return loop
+
+
+@atexit.register
+def _close_thread_loops() -> None:
+    """Close each per-thread loop's LLM connection pools, then the loop, at exit."""
+    with _thread_loops_lock:
+        for loop in _thread_loops:
+            if loop.is_closed() or loop.is_running():
+                continue
+            try:
+                # Pools can only be closed on the loop that opened them
+                loop.run_until_complete(llm_client.aclose())
+            except Exception as e:
+                logger.debug("Could not close LLM pools for guardrail loop: %s", e)
+            loop.close()
+        _thread_loops.clear()
+
 
 class EntityValidationResult(BaseModel):
     """Structured output schema for entity validation.
@@ -44,7 +89,9 @@ class EntityValidationResult(BaseModel):
     passed: bool = Field(description="True if overall validation passed (no mismatches found)")
 
 
-# Validation prompt for LLM-based entity verification
+# Validation prompts for LLM-based entity verification
+ENTITY_VALIDATION_SYSTEM = "You are a validation assistant."
+
 ENTITY_VALIDATION_PROMPT = """Validate the following draft email for entity accuracy.
 
 EXPECTED ENTITIES:
@@ -89,48 +136,24 @@ class EntityVerificationGuardrail(BaseGuardrail):
             name="entity_verification",
             severity=GuardrailSeverity.CRITICAL,
         )
+        # Retries and regenerated drafts often re-validate the same text for
+        # the same party; the prompt embeds draft, customer code and party
+        # name, so it keys the cache. Guardrails run on worker threads, so
+        # cache access is locked.
+        self.response_cache = LLMResponseCache(
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+        )
+        self._cache_lock = threading.Lock()
 
     def validate(self, output: str, context: CaseContext, **kwargs) -> list[GuardrailResult]:
         """
         Validate entity identifiers using LLM-based verification with retry.
 
-        Runs the LLM synchronously using asyncio.run() since guardrails
+        Runs the LLM synchronously on a per-thread event loop since guardrails
         execute in a thread pool. Retries on failure with exponential backoff.
         """
-        results = []
-
-        # Run LLM-based entity validation with retry
-        last_error = None
-        for attempt in range(MAX_RETRIES):
-            try:
-                llm_result = self._validate_entities_with_llm(output, context)
-                results.extend(llm_result)
-                last_error = None
-                break
-            except Exception as e:
-                last_error = e
-                if attempt < MAX_RETRIES - 1:
-                    backoff = INITIAL_BACKOFF_SECONDS * (2**attempt)
-                    logger.warning(
-                        "Entity validation attempt %d failed: %s. Retrying in %.1fs...",
-                        attempt + 1,
-                        e,
-                        backoff,
-                    )
-                    time.sleep(backoff)
-                else:
-                    logger.error("Entity validation failed after %d attempts: %s", MAX_RETRIES, e)
-
-        # If all retries failed, fail the guardrail (don't silently pass)
-        if last_error is not None:
-            results.append(
-                self._fail(
-                    message=f"Entity validation failed: {last_error}",
-                    expected="Valid LLM response",
-                    found=str(last_error),
-                    details={"error": str(last_error), "retries": MAX_RETRIES},
-                )
-            )
+        results = self._validate_entities_with_llm(output, context)
 
         # Only validate emails if extracted_data is provided (keep this deterministic)
         extracted_data = kwargs.get("extracted_data")
@@ -139,17 +162,119 @@ class EntityVerificationGuardrail(BaseGuardrail):
 
         return results
 
+    def validate_batch(self, drafts: list[tuple[str, CaseContext]]) -> list[list[GuardrailResult]]:
+        """
+        Validate entity identifiers for several drafts at once.
+
+        The LLM checks for all drafts run concurrently on this thread's event
+        loop, so N drafts cost roughly one round trip instead of N, and one
+        draft's retry backoff overlaps the others' calls. Each draft keeps its
+        own prompt so one hallucinated identifier can't bleed into another
+        draft's verdict.
+
+        Returns one list of GuardrailResults per draft, in input order.
+        """
+        if not drafts:
+            return []
+
+        async def check_all() -> list:
+            return await asyncio.gather(
+                *(self._check_entities_with_retry(output, context) for output, context in drafts),
+                return_exceptions=True,
+            )
+
+        checks = _get_thread_loop().run_until_complete(check_all())
+
+        return [
+            [self._llm_failure(check)]
+            if isinstance(check, Exception)
+            else self._results_from_check(check, context)
+            for (_, context), check in zip(drafts, checks)
+        ]
+
     def _validate_entities_with_llm(
         self, output: str, context: CaseContext
     ) -> list[GuardrailResult]:
         """
         Use LLM to validate entity accuracy with structured output.
 
+        Returns list of GuardrailResults for customer code and party name,
+        or a single failure if every attempt failed.
+        """
+        # Run async LLM call in sync context (guardrails run in thread pool)
+        try:
+            result = _get_thread_loop().run_until_complete(
+                self._check_entities_with_retry(output, context)
+            )
+        except Exception as e:
+            # If all retries failed, fail the guardrail (don't silently pass)
+            return [self._llm_failure(e)]
+
+        return self._results_from_check(result, context)
+
+    async def _check_entities_with_retry(
+        self, output: str, context: CaseContext
+    ) -> EntityValidationResult:
+        """
+        Run _check_entities, retrying failures with exponential backoff.
+
+        The whole sequence, retries and backoff included, is bounded by
+        guardrail_llm_deadline_seconds, so a stuck provider can't hold a
+        guardrail worker for several full timeouts. Individual calls keep
+        the providers' own timeout, retries and fallback. Backoff awaits on
+        the event loop rather than sleeping the thread, so other checks on
+        the same loop (validate_batch) keep running.
+        """
+        deadline = asyncio.timeout(settings.guardrail_llm_deadline_seconds)
+        try:
+            async with deadline:
+                for attempt in range(MAX_RETRIES):
+                    try:
+                        return await self._check_entities(output, context)
+                    except _NON_RETRYABLE_ERRORS as e:
+                        logger.error("Entity validation returned an invalid response: %s", e)
+                        raise
+                    except Exception as e:
+                        if attempt == MAX_RETRIES - 1:
+                            logger.error(
+                                "Entity validation failed after %d attempts: %s", MAX_RETRIES, e
+                            )
+                            raise
+                        backoff = INITIAL_BACKOFF_SECONDS * (2**attempt)
+                        logger.warning(
+                            "Entity validation attempt %d failed: %s. Retrying in %.1fs...",
+                            attempt + 1,
+                            e,
+                            backoff,
+                        )
+                        await asyncio.sleep(backoff)
+        except TimeoutError:
+            if not deadline.expired():
+                raise
+            logger.error(
+                "Entity validation exceeded its %ds deadline",
+                settings.guardrail_llm_deadline_seconds,
+            )
+            raise TimeoutError(
+                f"Entity validation exceeded {settings.guardrail_llm_deadline_seconds}s deadline"
+            ) from None
+
+    def _llm_failure(self, error: Exception) -> GuardrailResult:
+        """Build the failure result for an LLM check that exhausted its retries."""
+        return self._fail(
+            message=f"Entity validation failed: {error}",
+            expected="Valid LLM response",
+            found=str(error),
+            details={"error": str(error), "retries": MAX_RETRIES},
+        )
+
+    async def _check_entities(self, output: str, context: CaseContext) -> EntityValidationResult:
+        """
+        Ask the LLM to check one draft's entities.
+
         Uses response_schema parameter to ensure the LLM returns valid JSON
         matching EntityValidationResult schema. This is more reliable than
         json_mode alone, which can still return markdown-wrapped JSON.
-
-        Returns list of GuardrailResults for customer code and party name.
         """
         prompt = ENTITY_VALIDATION_PROMPT.format(
             customer_code=context.party.customer_code,
@@ -157,79 +282,77 @@ class EntityVerificationGuardrail(BaseGuardrail):
             draft=output,
         )
 
-        # Run async LLM call in sync context (guardrails run in thread pool)
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                response = loop.run_until_complete(
-                    llm_client.complete(
-                        system_prompt="You are a validation assistant.",
-                        user_prompt=prompt,
-                        temperature=0,  # Deterministic for validation
-                        max_tokens=2048,  # High for reasoning models that consume tokens for "thinking"
-                        # Use structured output for guaranteed valid JSON
-                        response_schema=EntityValidationResult,
-                    )
-                )
-            finally:
-                loop.close()
-        except Exception as e:
-            logger.error("LLM call failed in entity verification: %s", e)
-            raise
+        cache_key = LLMResponseCache.make_key(ENTITY_VALIDATION_SYSTEM, prompt, 0)
+        with self._cache_lock:
+            cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await llm_client.complete(
+            system_prompt=ENTITY_VALIDATION_SYSTEM,
+            user_prompt=prompt,
+            temperature=0,  # Deterministic for validation
+            max_tokens=2048,  # High for reasoning models that consume tokens for "thinking"
+            # Use structured output for guaranteed valid JSON
+            response_schema=EntityValidationResult,
+        )
 
-        # Parse the response - should be clean JSON from structured output
-        result = json.loads(response.content)
+        # Parse and validate the structured output in one pydantic-core pass;
+        # the cache then holds the typed model, not JSON text
+        result = EntityValidationResult.model_validate_json(response.content)
+        with self._cache_lock:
+            self.response_cache.set(cache_key, result)
+        return result
 
+    def _results_from_check(
+        self, result: EntityValidationResult, context: CaseContext
+    ) -> list[GuardrailResult]:
+        """Convert a parsed EntityValidationResult into GuardrailResults."""
         results = []
 
         # Customer code validation result
-        if result.get("customer_code_valid", True):
+        if result.customer_code_valid:
             results.append(
                 self._pass(
-                    message=result.get("customer_code_reason", "Customer code validated"),
+                    message=result.customer_code_reason or "Customer code validated",
                     details={"customer_code": context.party.customer_code},
                 )
             )
         else:
             results.append(
                 self._fail(
-                    message=result.get(
-                        "customer_code_reason",
-                        f"Customer code validation failed for {context.party.customer_code}",
-                    ),
+                    message=result.customer_code_reason
+                    or f"Customer code validation failed for {context.party.customer_code}",
                     expected=context.party.customer_code,
                     found=None,
-                    details={"issues": result.get("issues_found", [])},
+                    details={"issues": list(result.issues_found)},
                 )
             )
 
         # Party name validation result
-        if result.get("party_name_valid", True):
+        if result.party_name_valid:
             results.append(
                 self._pass(
-                    message=result.get("party_name_reason", "Party name validated"),
+                    message=result.party_name_reason or "Party name validated",
                     details={"party_name": context.party.name},
                 )
             )
         else:
             results.append(
                 self._fail(
-                    message=result.get(
-                        "party_name_reason",
-                        f"Party name validation failed for {context.party.name}",
-                    ),
+                    message=result.party_name_reason
+                    or f"Party name validation failed for {context.party.name}",
                     expected=context.party.name,
                     found=None,
-                    details={"issues": result.get("issues_found", [])},
+                    details={"issues": list(result.issues_found)},
                 )
             )
 
         logger.info(
             "Entity verification completed: customer_code_valid=%s, party_name_valid=%s, passed=%s",
-            result.get("customer_code_valid"),
-            result.get("party_name_valid"),
-            result.get("passed"),
+            result.customer_code_valid,
+            result.party_name_valid,
+            result.passed,
         )
 
         return results
@@ -238,9 +361,10 @@ class EntityVerificationGuardrail(BaseGuardrail):
         self, output: str, _context: CaseContext, extracted_data: Any
     ) -> GuardrailResult:
         """Validate that email addresses are not fabricated."""
-        # Extract email addresses from output
-        email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-        found_emails = set(re.findall(email_pattern, output))
+        # Extract email addresses from output. Most drafts contain no "@", and
+        # the substring check skips the regex, which backtracks through every
+        # run of local-part characters before giving up
+        found_emails = set(_EMAIL_RE.findall(output)) if "@" in output else set()
 
         if not found_emails:
             return self._pass(message="No email addresses to validate")
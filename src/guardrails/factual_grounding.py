@@ -9,6 +9,26 @@ from .base import BaseGuardrail, GuardrailResult, GuardrailSeverity
 
 logger = logging.getLogger(__name__)
 
+# Invoice references in output. Matches: INV-12345, INV12345, Invoice 12345, #12345, etc.
+# NOTE: Patterns must be restrictive to avoid false positives with garbage chars
+_INVOICE_RES = (
+    re.compile(r"INV[-\s]?(\d+)", re.IGNORECASE),  # INV-12345, INV 12345, INV12345
+    re.compile(r"Invoice\s*#?\s*(\d+)", re.IGNORECASE),  # Invoice 12345, Invoice #12345
+    re.compile(
+        r"invoice\s+number\s*:?\s*([A-Za-z0-9][-A-Za-z0-9]+)", re.IGNORECASE
+    ),  # invoice number: ABC-123 (alphanumeric only)
+    re.compile(r"#(\d{4,})", re.IGNORECASE),  # #12345 (4+ digits to avoid false positives)
+)
+
+# Currency amounts in output. Matches: £1,500.00, $1500, €1,000, GBP 1000, etc.
+_AMOUNT_RES = (
+    re.compile(r"[£$€]\s*([\d,]+(?:\.\d{2})?)"),  # £1,500.00
+    re.compile(r"([\d,]+(?:\.\d{2})?)\s*(?:GBP|USD|EUR)"),  # 1500 GBP
+    re.compile(r"(?:GBP|USD|EUR)\s*([\d,]+(?:\.\d{2})?)"),  # GBP 1500
+)
+
+_DIGITS_RE = re.compile(r"\d+")
+
 
 class FactualGroundingGuardrail(BaseGuardrail):
     """
@@ -38,16 +58,6 @@ class FactualGroundingGuardrail(BaseGuardrail):
 
     def _validate_invoice_numbers(self, output: str, context: CaseContext) -> GuardrailResult:
         """Validate that all invoice numbers in output exist in context."""
-        # Extract invoice numbers from output using common patterns
-        # Matches: INV-12345, INV12345, Invoice 12345, #12345, etc.
-        # NOTE: Patterns must be restrictive to avoid false positives with garbage chars
-        invoice_patterns = [
-            r"INV[-\s]?(\d+)",  # INV-12345, INV 12345, INV12345
-            r"Invoice\s*#?\s*(\d+)",  # Invoice 12345, Invoice #12345
-            r"invoice\s+number\s*:?\s*([A-Za-z0-9][-A-Za-z0-9]+)",  # invoice number: ABC-123 (alphanumeric only)
-            r"#(\d{4,})",  # #12345 (4+ digits to avoid false positives)
-        ]
-
         # Get valid invoice numbers from context
         valid_invoices = {o.invoice_number.upper() for o in context.obligations}
 
@@ -55,7 +65,7 @@ class FactualGroundingGuardrail(BaseGuardrail):
         valid_invoice_numbers = set()
         for inv in valid_invoices:
             # Extract numeric portion
-            match = re.search(r"\d+", inv)
+            match = _DIGITS_RE.search(inv)
             if match:
                 valid_invoice_numbers.add(match.group())
 
@@ -69,8 +79,8 @@ class FactualGroundingGuardrail(BaseGuardrail):
                 found_invoices.add(inv)
 
         # Then look for pattern-based matches
-        for pattern in invoice_patterns:
-            matches = re.findall(pattern, output, re.IGNORECASE)
+        for pattern in _INVOICE_RES:
+            matches = pattern.findall(output)
             for match in matches:
                 found_invoices.add(match.upper() if isinstance(match, str) else match)
 
@@ -105,14 +115,6 @@ class FactualGroundingGuardrail(BaseGuardrail):
 
     def _validate_amounts(self, output: str, context: CaseContext) -> GuardrailResult:
         """Validate that monetary amounts in output match context data."""
-        # Extract currency and amounts from output
-        # Matches: £1,500.00, $1500, €1,000, GBP 1000, etc.
-        amount_patterns = [
-            r"[£$€]\s*([\d,]+(?:\.\d{2})?)",  # £1,500.00
-            r"([\d,]+(?:\.\d{2})?)\s*(?:GBP|USD|EUR)",  # 1500 GBP
-            r"(?:GBP|USD|EUR)\s*([\d,]+(?:\.\d{2})?)",  # GBP 1500
-        ]
-
         # Build set of valid amounts
         valid_amounts = set()
 
@@ -131,8 +133,8 @@ class FactualGroundingGuardrail(BaseGuardrail):
 
         # Extract amounts from output
         found_amounts = []
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, output)
+        for pattern in _AMOUNT_RES:
+            matches = pattern.findall(output)
             for match in matches:
                 # Clean and parse the amount
                 cleaned = match.replace(",", "").replace(" ", "")
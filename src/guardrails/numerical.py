@@ -9,6 +9,23 @@ from .base import BaseGuardrail, GuardrailResult, GuardrailSeverity
 
 logger = logging.getLogger(__name__)
 
+# Stated totals in output
+_TOTAL_RES = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"total\s+(?:outstanding|amount|due|owed)(?:\s+(?:is|of))?\s*:?\s*[£$€]?\s*([\d,]+(?:\.\d{2})?)",
+        r"owe(?:s|d)?\s+(?:us\s+)?(?:a\s+total\s+of\s+)?[£$€]?\s*([\d,]+(?:\.\d{2})?)",
+        r"[£$€]\s*([\d,]+(?:\.\d{2})?)\s+(?:in\s+)?total",
+        r"combined\s+(?:balance|amount)\s+(?:of|is)\s+[£$€]?\s*([\d,]+(?:\.\d{2})?)",
+    )
+)
+
+# Days overdue mentions in output
+_DAYS_RES = (
+    re.compile(r"(\d+)\s+days?\s+(?:past\s+due|overdue|late)", re.IGNORECASE),
+    re.compile(r"overdue\s+(?:by|for)\s+(\d+)\s+days?", re.IGNORECASE),
+)
+
 
 class NumericalConsistencyGuardrail(BaseGuardrail):
     """
@@ -38,21 +55,13 @@ class NumericalConsistencyGuardrail(BaseGuardrail):
 
     def _validate_total_calculation(self, output: str, context: CaseContext) -> GuardrailResult:
         """Validate that stated totals match calculated sums."""
-        # Extract total phrases from output
-        total_patterns = [
-            r"total\s+(?:outstanding|amount|due|owed)(?:\s+(?:is|of))?\s*:?\s*[£$€]?\s*([\d,]+(?:\.\d{2})?)",
-            r"owe(?:s|d)?\s+(?:us\s+)?(?:a\s+total\s+of\s+)?[£$€]?\s*([\d,]+(?:\.\d{2})?)",
-            r"[£$€]\s*([\d,]+(?:\.\d{2})?)\s+(?:in\s+)?total",
-            r"combined\s+(?:balance|amount)\s+(?:of|is)\s+[£$€]?\s*([\d,]+(?:\.\d{2})?)",
-        ]
-
         # Calculate actual total
         actual_total = sum(o.amount_due for o in context.obligations)
 
         # Find stated totals
         stated_totals = []
-        for pattern in total_patterns:
-            matches = re.findall(pattern, output, re.IGNORECASE)
+        for pattern in _TOTAL_RES:
+            matches = pattern.findall(output)
             for match in matches:
                 try:
                     stated = float(match.replace(",", ""))
@@ -89,12 +98,6 @@ class NumericalConsistencyGuardrail(BaseGuardrail):
 
     def _validate_days_overdue(self, output: str, context: CaseContext) -> GuardrailResult:
         """Validate that days overdue statements are accurate."""
-        # Extract days overdue mentions
-        days_patterns = [
-            r"(\d+)\s+days?\s+(?:past\s+due|overdue|late)",
-            r"overdue\s+(?:by|for)\s+(\d+)\s+days?",
-        ]
-
         # Get valid days overdue from context
         valid_days = {o.days_past_due for o in context.obligations}
 
@@ -103,8 +106,8 @@ class NumericalConsistencyGuardrail(BaseGuardrail):
         valid_days.add(max_days)
 
         # Find mentioned days
-        for pattern in days_patterns:
-            matches = re.findall(pattern, output, re.IGNORECASE)
+        for pattern in _DAYS_RES:
+            matches = pattern.findall(output)
             for match in matches:
                 try:
                     mentioned_days = int(match)
@@ -11,6 +11,18 @@ from .base import BaseGuardrail, GuardrailResult, GuardrailSeverity
 
 logger = logging.getLogger(__name__)
 
+# Due date mentions in output
+_DUE_DATE_RES = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"due\s+(?:on|by)\s+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})",
+        r"due\s+date[:\s]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})",
+        r"(\d{1,2}(?:st|nd|rd|th)?\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4})",
+    )
+)
+
+_ORDINAL_RE = re.compile(r"(\d+)(?:st|nd|rd|th)")
+
 
 class TemporalConsistencyGuardrail(BaseGuardrail):
     """
@@ -85,13 +97,6 @@ class TemporalConsistencyGuardrail(BaseGuardrail):
 
     def _validate_due_dates(self, output: str, context: CaseContext) -> GuardrailResult:
         """Validate that mentioned due dates match obligation data."""
-        # Extract date patterns from output
-        date_patterns = [
-            r"due\s+(?:on|by)\s+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})",
-            r"due\s+date[:\s]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})",
-            r"(\d{1,2}(?:st|nd|rd|th)?\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4})",
-        ]
-
         # Get valid due dates from context
         valid_due_dates = set()
         for o in context.obligations:
@@ -103,8 +108,8 @@ class TemporalConsistencyGuardrail(BaseGuardrail):
 
         # Find mentioned dates
         mentioned_dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, output, re.IGNORECASE)
+        for pattern in _DUE_DATE_RES:
+            matches = pattern.findall(output)
             for match in matches:
                 parsed = self._parse_date(match)
                 if parsed:
@@ -151,7 +156,7 @@ class TemporalConsistencyGuardrail(BaseGuardrail):
         # Try parsing natural dates like "15th January 2024"
         try:
             # Remove ordinal suffixes
-            cleaned = re.sub(r"(\d+)(?:st|nd|rd|th)", r"\1", date_str)
+            cleaned = _ORDINAL_RE.sub(r"\1", date_str)
             return datetime.strptime(cleaned, "%d %B %Y").date()
         except ValueError:
             pass
@@ -1,5 +1,6 @@
 """Base LLM provider abstraction."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Type
 
@@ -12,10 +13,54 @@ class LLMResponse(BaseModel):
     content: str
     model: str
     provider: str  # "openai", "gemini", etc.
-    usage: Dict[str, int]  # prompt_tokens, completion_tokens, total_tokens
+    usage: Dict[str, int]  # prompt_tokens, completion_tokens, total_tokens, cached_tokens
     raw_response: Optional[Dict[str, Any]] = None
 
 
+def running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """
+    Return the running event loop, or None outside one.
+
+    Pooled HTTP connections belong to the loop that opened them, so providers
+    key their clients on it: the app's loop and each guardrail worker
+    thread's loop get their own keep-alive pool.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def prune_closed_loops(by_loop: Dict[Any, Any]) -> None:
+    """
+    Drop entries whose event loop has been closed.
+
+    Their pools can neither be reused nor closed any more, and keeping them
+    would hold the dead loop and its sockets alive for the process lifetime.
+    """
+    for loop in list(by_loop):
+        if loop is not None and loop.is_closed():
+            by_loop.pop(loop, None)
+
+
+def usage_from_metadata(usage_metadata: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Convert LangChain usage metadata into the LLMResponse usage dict.
+
+    cached_tokens counts input tokens served from the provider's prompt
+    cache, so prefix-cache hit rates show up in the call logs.
+    """
+    if not usage_metadata:
+        return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "cached_tokens": 0}
+    input_details = usage_metadata.get("input_token_details") or {}
+    return {
+        "prompt_tokens": usage_metadata.get("input_tokens", 0),
+        "completion_tokens": usage_metadata.get("output_tokens", 0),
+        "total_tokens": usage_metadata.get("total_tokens", 0),
+        "cached_tokens": input_details.get("cache_read", 0),
+    }
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for all LLM providers."""
 
@@ -44,6 +89,10 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Release pooled HTTP connections held by the provider."""
+        return None
+
     @abstractmethod
     async def health_check(self) -> Dict[str, Any]:
         """Check provider availability and return model info."""
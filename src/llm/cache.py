@@ -0,0 +1,90 @@
+"""In-process exact-match cache for parsed LLM responses."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from src.config.settings import settings
+
+
+def _primary_model() -> str:
+    """Model name of the configured primary provider (without initializing it)."""
+    return settings.gemini_model if settings.llm_provider == "gemini" else settings.openai_model
+
+
+def normalize_prompt(text: str) -> str:
+    """
+    Canonicalize prompt whitespace for cache keys.
+
+    Re-wrapped lines, repeated spaces and trailing blank lines don't change
+    how an email is classified, so they map to the same key. Case is kept:
+    the prompt carries names, codes and addresses that the LLM echoes into
+    extracted_data, so differently-cased emails must not share an entry.
+    """
+    return " ".join(text.split())
+
+
+class LLMResponseCache:
+    """
+    LRU cache with per-entry TTL, keyed on the exact prompt sent to the LLM.
+
+    Stores the already-validated response model, so hits skip the LLM round
+    trip as well as JSON parsing and schema validation. Entries are only
+    read and written from the event loop thread with no await in between,
+    so no lock is needed.
+
+    A max_entries of 0 disables the cache.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(system_prompt: str, user_prompt: str, temperature: float) -> str:
+        """Hash everything that determines the LLM output."""
+        digest = hashlib.sha256()
+        for part in (settings.llm_provider, _primary_model(), repr(temperature)):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(system_prompt.encode())
+        digest.update(b"\0")
+        digest.update(user_prompt.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        if not self.max_entries:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if not self.max_entries:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
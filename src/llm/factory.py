@@ -179,6 +179,12 @@ class LLMProviderWithFallback:
             "fallback_count": self.fallback_count,
         }
 
+    async def aclose(self) -> None:
+        """Close connection pools of any providers that were initialized."""
+        for provider in (self._primary, self._fallback):
+            if provider is not None:
+                await provider.aclose()
+
     @property
     def provider_name(self) -> str:
         return self.primary.provider_name
@@ -2,7 +2,7 @@
 
 import logging
 import time
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -16,7 +16,13 @@ from tenacity import (
 
 from src.config.settings import settings
 
-from .base import BaseLLMProvider, LLMResponse
+from .base import (
+    BaseLLMProvider,
+    LLMResponse,
+    prune_closed_loops,
+    running_loop,
+    usage_from_metadata,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -63,16 +69,73 @@ class GeminiProvider(BaseLLMProvider):
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY not provided (set via environment or .env file)")
 
+        # Chat clients per event loop, keyed by call configuration. Each chat
+        # model owns an HTTP connection pool, so reusing them keeps TLS
+        # sessions alive across calls; pools are bound to the loop that
+        # opened them.
+        self._clients: Dict[Any, Dict[Tuple, Any]] = {}
+        # Underlying chat models per event loop, whose pools aclose() closes
+        self._chat_models: Dict[Any, List[ChatGoogleGenerativeAI]] = {}
+
         # LangChain handles all Gemini API complexity
-        self.client = ChatGoogleGenerativeAI(
-            model=self._model,
-            google_api_key=self.api_key,
-            temperature=self._temperature,
-            max_output_tokens=self._max_tokens,
-        )
+        self.client = self._get_client(self._temperature, self._max_tokens)
 
         logger.info(f"Initialized Gemini provider with model: {self._model}")
 
+    def _get_client(
+        self,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool = False,
+        response_schema: Optional[Type[BaseModel]] = None,
+    ):
+        """Return the cached LangChain runnable for this configuration, creating it once."""
+        loop = running_loop()
+        loop_clients = self._clients.get(loop)
+        if loop_clients is None:
+            prune_closed_loops(self._clients)
+            prune_closed_loops(self._chat_models)
+            loop_clients = self._clients[loop] = {}
+
+        key = (temperature, max_tokens, json_mode, response_schema)
+        client = loop_clients.get(key)
+        if client is None:
+            client_kwargs = {
+                "model": self._model,
+                "google_api_key": self.api_key,
+                "temperature": temperature,
+                "max_output_tokens": max_tokens,
+                "timeout": settings.llm_timeout_seconds,
+            }
+
+            # For JSON mode without schema, configure response_mime_type
+            if json_mode and not response_schema:
+                client_kwargs["response_mime_type"] = "application/json"
+
+            client = ChatGoogleGenerativeAI(**client_kwargs)
+            self._chat_models.setdefault(loop, []).append(client)
+            if response_schema:
+                # include_raw keeps the AIMessage so token usage is still reported
+                client = client.with_structured_output(
+                    response_schema,
+                    method="json_schema",  # More reliable than function_calling
+                    include_raw=True,
+                )
+            loop_clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Close the chat models' connection pools for the current event loop.
+
+        A pool can only be closed on its own loop; the entity guardrail's
+        exit hook calls this on each worker-thread loop.
+        """
+        loop = running_loop()
+        self._clients.pop(loop, None)
+        for chat_model in self._chat_models.pop(loop, []):
+            await chat_model.client.aio.aclose()
+
     @property
     def provider_name(self) -> str:
         return "gemini"
@@ -108,20 +171,13 @@ class GeminiProvider(BaseLLMProvider):
             # Build messages
             messages = [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
 
-            # Create client with appropriate settings
-            client_kwargs = {
-                "model": self._model,
-                "google_api_key": self.api_key,
-                "temperature": temperature if temperature is not None else self._temperature,
-                "max_output_tokens": max_tokens if max_tokens is not None else self._max_tokens,
-            }
-
-            # For JSON mode without schema, configure response_mime_type
-            if json_mode and not response_schema:
-                client_kwargs["response_mime_type"] = "application/json"
-
-            # Create client for this specific request
-            client = ChatGoogleGenerativeAI(**client_kwargs)
+            # Reuse the client for these settings (and its open connections)
+            client = self._get_client(
+                temperature if temperature is not None else self._temperature,
+                max_tokens if max_tokens is not None else self._max_tokens,
+                json_mode,
+                response_schema,
+            )
 
             logger.debug(
                 "Calling Gemini: model=%s, json_mode=%s, has_schema=%s",
@@ -147,11 +203,10 @@ class GeminiProvider(BaseLLMProvider):
 
             # Use structured output if schema provided (more reliable than json_mode)
             if response_schema:
-                structured_client = client.with_structured_output(
-                    response_schema,
-                    method="json_schema",  # More reliable than function_calling
-                )
-                result = await _invoke_with_retry(structured_client, messages)
+                output = await _invoke_with_retry(client, messages)
+                if output["parsing_error"] is not None:
+                    raise output["parsing_error"]
+                result = output["parsed"]
 
                 # Validate non-empty response (Gemini sometimes returns None or empty)
                 if result is None:
@@ -174,8 +229,7 @@ class GeminiProvider(BaseLLMProvider):
 
                 # Convert Pydantic model back to JSON string for consistent interface
                 content = result.model_dump_json()
-                # For structured output, we don't get usage metadata directly
-                usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+                usage = usage_from_metadata(output["raw"].usage_metadata)
                 latency_ms = (time.perf_counter() - start_time) * 1000
                 logger.info(
                     "LLM call completed",
@@ -186,6 +240,7 @@ class GeminiProvider(BaseLLMProvider):
                         "latency_ms": round(latency_ms, 2),
                         "input_tokens": usage["prompt_tokens"],
                         "output_tokens": usage["completion_tokens"],
+                        "cached_input_tokens": usage["cached_tokens"],
                         "success": True,
                         "structured": True,
                     },
@@ -202,17 +257,7 @@ class GeminiProvider(BaseLLMProvider):
             response = await _invoke_with_retry(client, messages)
 
             # Extract usage metadata (LangChain standardizes this)
-            usage = {
-                "prompt_tokens": response.usage_metadata.get("input_tokens", 0)
-                if response.usage_metadata
-                else 0,
-                "completion_tokens": response.usage_metadata.get("output_tokens", 0)
-                if response.usage_metadata
-                else 0,
-                "total_tokens": response.usage_metadata.get("total_tokens", 0)
-                if response.usage_metadata
-                else 0,
-            }
+            usage = usage_from_metadata(response.usage_metadata)
 
             # Extract content - handle both string and list formats
             content = response.content
@@ -233,6 +278,7 @@ class GeminiProvider(BaseLLMProvider):
                     "latency_ms": round(latency_ms, 2),
                     "input_tokens": usage["prompt_tokens"],
                     "output_tokens": usage["completion_tokens"],
+                    "cached_input_tokens": usage["cached_tokens"],
                     "success": True,
                     "structured": False,
                 },
@@ -2,8 +2,9 @@
 
 import logging
 import time
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Optional, Tuple, Type
 
+import httpx
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
@@ -16,7 +17,13 @@ from tenacity import (
 
 from src.config.settings import settings
 
-from .base import BaseLLMProvider, LLMResponse
+from .base import (
+    BaseLLMProvider,
+    LLMResponse,
+    prune_closed_loops,
+    running_loop,
+    usage_from_metadata,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -69,16 +76,83 @@ class OpenAIProvider(BaseLLMProvider):
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not provided (set via environment or .env file)")
 
+        # One keep-alive connection pool per event loop, shared by every chat
+        # client on that loop, so calls reuse open TLS connections instead of
+        # handshaking each time
+        self._http_clients: Dict[Any, httpx.AsyncClient] = {}
+        # Chat clients per event loop, keyed by call configuration
+        self._clients: Dict[Any, Dict[Tuple, Any]] = {}
+
         # LangChain handles all OpenAI API complexity
-        self.client = ChatOpenAI(
-            model=self._model,
-            openai_api_key=self.api_key,
-            temperature=self._temperature,
-            max_tokens=self._max_tokens,
-        )
+        self.client = self._get_client(self._temperature, self._max_tokens)
 
         logger.info(f"Initialized OpenAI provider with model: {self._model}")
 
+    def _get_client(
+        self,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool = False,
+        response_schema: Optional[Type[BaseModel]] = None,
+    ):
+        """Return the cached LangChain runnable for this configuration, creating it once."""
+        loop = running_loop()
+        loop_clients = self._clients.get(loop)
+        if loop_clients is None:
+            prune_closed_loops(self._clients)
+            prune_closed_loops(self._http_clients)
+            loop_clients = self._clients[loop] = {}
+
+        key = (temperature, max_tokens, json_mode, response_schema)
+        client = loop_clients.get(key)
+        if client is None:
+            client_kwargs = {
+                "model": self._model,
+                "openai_api_key": self.api_key,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "http_async_client": self._get_http_client(loop),
+            }
+
+            # For JSON mode without schema, configure response_format
+            if json_mode and not response_schema:
+                client_kwargs["model_kwargs"] = {"response_format": {"type": "json_object"}}
+
+            client = ChatOpenAI(**client_kwargs)
+            if response_schema:
+                # include_raw keeps the AIMessage so token usage is still reported
+                client = client.with_structured_output(
+                    response_schema, method="json_schema", include_raw=True
+                )
+            loop_clients[key] = client
+        return client
+
+    def _get_http_client(self, loop) -> httpx.AsyncClient:
+        """Return the connection pool for this event loop, creating it once."""
+        http_client = self._http_clients.get(loop)
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                timeout=settings.llm_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=200, max_keepalive_connections=50, keepalive_expiry=300
+                ),
+            )
+            self._http_clients[loop] = http_client
+        return http_client
+
+    async def aclose(self) -> None:
+        """
+        Close the connection pool for the current event loop.
+
+        A pool can only be closed on its own loop; the entity guardrail's
+        exit hook calls this on each worker-thread loop.
+        """
+        loop = running_loop()
+        self._clients.pop(loop, None)
+        http_client = self._http_clients.pop(loop, None)
+        if http_client is not None:
+            await http_client.aclose()
+
     @property
     def provider_name(self) -> str:
         return "openai"
@@ -113,20 +187,13 @@ class OpenAIProvider(BaseLLMProvider):
             # Build messages
             messages = [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
 
-            # Create client with appropriate settings
-            client_kwargs = {
-                "model": self._model,
-                "openai_api_key": self.api_key,
-                "temperature": temperature if temperature is not None else self._temperature,
-                "max_tokens": max_tokens if max_tokens is not None else self._max_tokens,
-            }
-
-            # For JSON mode without schema, configure response_format
-            if json_mode and not response_schema:
-                client_kwargs["model_kwargs"] = {"response_format": {"type": "json_object"}}
-
-            # Create client for this specific request
-            client = ChatOpenAI(**client_kwargs)
+            # Reuse the client for these settings (and the shared connection pool)
+            client = self._get_client(
+                temperature if temperature is not None else self._temperature,
+                max_tokens if max_tokens is not None else self._max_tokens,
+                json_mode,
+                response_schema,
+            )
 
             logger.debug(
                 "Calling OpenAI: model=%s, json_mode=%s, has_schema=%s",
@@ -152,13 +219,12 @@ class OpenAIProvider(BaseLLMProvider):
 
             # Use structured output if schema provided (more reliable)
             if response_schema:
-                structured_client = client.with_structured_output(
-                    response_schema,
-                    method="json_schema",
-                )
-                result = await _invoke_with_retry(structured_client, messages)
+                output = await _invoke_with_retry(client, messages)
+                if output["parsing_error"] is not None:
+                    raise output["parsing_error"]
+                result = output["parsed"]
                 content = result.model_dump_json()
-                usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+                usage = usage_from_metadata(output["raw"].usage_metadata)
                 latency_ms = (time.perf_counter() - start_time) * 1000
                 logger.info(
                     "LLM call completed",
@@ -169,6 +235,7 @@ class OpenAIProvider(BaseLLMProvider):
                         "latency_ms": round(latency_ms, 2),
                         "input_tokens": usage["prompt_tokens"],
                         "output_tokens": usage["completion_tokens"],
+                        "cached_input_tokens": usage["cached_tokens"],
                         "success": True,
                         "structured": True,
                     },
@@ -185,17 +252,7 @@ class OpenAIProvider(BaseLLMProvider):
             response = await _invoke_with_retry(client, messages)
 
             # Extract usage metadata (LangChain standardizes this)
-            usage = {
-                "prompt_tokens": response.usage_metadata.get("input_tokens", 0)
-                if response.usage_metadata
-                else 0,
-                "completion_tokens": response.usage_metadata.get("output_tokens", 0)
-                if response.usage_metadata
-                else 0,
-                "total_tokens": response.usage_metadata.get("total_tokens", 0)
-                if response.usage_metadata
-                else 0,
-            }
+            usage = usage_from_metadata(response.usage_metadata)
 
             latency_ms = (time.perf_counter() - start_time) * 1000
             logger.info(
@@ -207,6 +264,7 @@ class OpenAIProvider(BaseLLMProvider):
                     "latency_ms": round(latency_ms, 2),
                     "input_tokens": usage["prompt_tokens"],
                     "output_tokens": usage["completion_tokens"],
+                    "cached_input_tokens": usage["cached_tokens"],
                     "success": True,
                     "structured": False,
                 },
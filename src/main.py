@@ -12,12 +12,14 @@ Security:
 - Structured error responses (no sensitive data leakage)
 """
 
+import asyncio
+import contextlib
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
@@ -26,12 +28,11 @@ from src.api.errors import ErrorCode, ErrorResponse, SolvixBaseError
 from src.api.middleware import RequestIDMiddleware, get_request_id
 from src.api.routes import classify, gates, generate, health
 from src.config.settings import settings
+from src.llm.factory import llm_client
+from src.utils.logging_config import configure_logging
 
 # Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+configure_logging(settings.log_level, settings.log_format)
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 # Prevents DDoS, API quota exhaustion, and billing abuse
 # Rates are per-IP address by default
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, enabled=settings.rate_limit_enabled)
 
 
 @asynccontextmanager
@@ -52,8 +53,16 @@ async def lifespan(app: FastAPI):
     logger.info(f"Provider: {settings.llm_provider}, Model: {model}")
     logger.info(f"Port: {settings.api_port}")
     logger.info(f"Debug: {settings.debug}")
-    logger.info("Rate limiting: ENABLED")
+    logger.info(f"Rate limiting: {'ENABLED' if settings.rate_limit_enabled else 'DISABLED'}")
+
+    # Probe LLM providers in the background so /health never blocks on them
+    health_task = asyncio.create_task(health.run_health_refresher())
     yield
+    health_task.cancel()
+    # Let an in-flight probe unwind before its connection pool is closed
+    with contextlib.suppress(asyncio.CancelledError):
+        await health_task
+    await llm_client.aclose()
 
 
 # Create app
@@ -62,6 +71,8 @@ app = FastAPI(
     description="AI-powered email classification and draft generation for debt collection",
     version="0.1.0",
     lifespan=lifespan,
+    # Serialize responses with orjson (C-level encoder) instead of stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # Attach limiter to app state (required by slowapi)
@@ -88,9 +99,20 @@ else:
     logger.warning("CORS disabled - no origins configured and not in debug mode")
 
 
+def _error_response(status_code: int, error_response: ErrorResponse) -> Response:
+    """Serialize an ErrorResponse straight to JSON bytes."""
+    # model_dump_json encodes the timestamp and error code in pydantic-core,
+    # skipping the intermediate dict that model_dump(mode="json") builds
+    return Response(
+        content=error_response.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 # Global exception handler for structured error responses
 @app.exception_handler(SolvixBaseError)
-async def solvix_error_handler(request: Request, exc: SolvixBaseError) -> JSONResponse:
+async def solvix_error_handler(request: Request, exc: SolvixBaseError) -> Response:
     """Handle all Solvix custom exceptions with structured response."""
     error_response = ErrorResponse(
         error=exc.message,
@@ -98,14 +120,11 @@ async def solvix_error_handler(request: Request, exc: SolvixBaseError) -> JSONRe
         details=exc.details,
         request_id=get_request_id(),
     )
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=error_response.model_dump(mode="json"),
-    )
+    return _error_response(exc.status_code, error_response)
 
 
 @app.exception_handler(Exception)
-async def generic_error_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_error_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected exceptions with structured response."""
     logger.exception(f"Unhandled exception: {exc}")
     error_response = ErrorResponse(
@@ -114,10 +133,7 @@ async def generic_error_handler(request: Request, exc: Exception) -> JSONRespons
         details={"exception_type": type(exc).__name__} if settings.debug else None,
         request_id=get_request_id(),
     )
-    return JSONResponse(
-        status_code=500,
-        content=error_response.model_dump(mode="json"),
-    )
+    return _error_response(500, error_response)
 
 
 # Include routers
@@ -1,6 +1,14 @@
 """Utility modules for solvix-ai."""
 
 from .json_extractor import JSONExtractionError, extract_json
+from .logging_config import JSONLogFormatter, configure_logging
 from .metrics import log_metric, timed_operation
 
-__all__ = ["extract_json", "JSONExtractionError", "timed_operation", "log_metric"]
+__all__ = [
+    "extract_json",
+    "JSONExtractionError",
+    "timed_operation",
+    "log_metric",
+    "JSONLogFormatter",
+    "configure_logging",
+]
@@ -11,13 +11,21 @@ LLMs can return JSON in various formats:
 This module handles all these cases.
 """
 
-import json
 import logging
 import re
 from typing import Any, Dict
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Matches: ```json, ```JSON, ```, etc.
+_CODE_BLOCK_RE = re.compile(
+    r"^```(?:json|JSON|javascript|JS)?\s*\n?(.*?)\n?```\s*$", re.DOTALL | re.IGNORECASE
+)
+# Trailing commas before } or ]
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
 
 class JSONExtractionError(Exception):
     """Raised when JSON extraction fails after all attempts."""
@@ -58,47 +66,47 @@ def extract_json(content: str) -> Dict[str, Any]:
 
     # Strategy 1: Direct parse
     try:
-        result = json.loads(content)
+        result = orjson.loads(content)
         if isinstance(result, dict):
             return result
         attempts.append(f"Direct parse returned {type(result).__name__}, not dict")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         attempts.append(f"Direct parse failed: {e}")
 
     # Strategy 2: Strip markdown code blocks
     stripped = _strip_markdown_code_blocks(content)
     if stripped != content:
         try:
-            result = json.loads(stripped)
+            result = orjson.loads(stripped)
             if isinstance(result, dict):
                 logger.debug("JSON extracted after stripping markdown code blocks")
                 return result
             attempts.append(f"Stripped parse returned {type(result).__name__}, not dict")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             attempts.append(f"Stripped markdown parse failed: {e}")
 
     # Strategy 3: Find JSON object in content
     extracted = _find_json_object(content)
     if extracted:
         try:
-            result = json.loads(extracted)
+            result = orjson.loads(extracted)
             if isinstance(result, dict):
                 logger.debug("JSON extracted using regex object finder")
                 return result
             attempts.append(f"Regex extracted parse returned {type(result).__name__}, not dict")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             attempts.append(f"Regex extraction parse failed: {e}")
 
     # Strategy 4: Clean content (trailing commas, etc.) and retry
     cleaned = _clean_json_content(stripped if stripped != content else content)
     if cleaned != content and cleaned != stripped:
         try:
-            result = json.loads(cleaned)
+            result = orjson.loads(cleaned)
             if isinstance(result, dict):
                 logger.debug("JSON extracted after cleaning content")
                 return result
             attempts.append(f"Cleaned parse returned {type(result).__name__}, not dict")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             attempts.append(f"Cleaned content parse failed: {e}")
 
     # All strategies failed
@@ -126,10 +134,8 @@ def _strip_markdown_code_blocks(content: str) -> str:
     # Remove BOM if present
     content = content.lstrip("\ufeff")
 
-    # Pattern for code blocks with optional language specifier
-    # Matches: ```json, ```JSON, ```, etc.
-    pattern = r"^```(?:json|JSON|javascript|JS)?\s*\n?(.*?)\n?```\s*$"
-    match = re.match(pattern, content.strip(), re.DOTALL | re.IGNORECASE)
+    # Code blocks with optional language specifier
+    match = _CODE_BLOCK_RE.match(content.strip())
     if match:
         return match.group(1).strip()
 
@@ -157,12 +163,7 @@ def _find_json_object(content: str) -> str | None:
     This is more reliable than regex for nested objects.
     """
     # Find first { that starts a JSON object
-    start = -1
-    for i, char in enumerate(content):
-        if char == "{":
-            start = i
-            break
-
+    start = content.find("{")
     if start == -1:
         return None
 
@@ -214,6 +215,6 @@ def _clean_json_content(content: str) -> str:
     """
     # Remove trailing commas before closing braces/brackets
     # This is a common LLM mistake
-    content = re.sub(r",\s*([}\]])", r"\1", content)
+    content = _TRAILING_COMMA_RE.sub(r"\1", content)
 
     return content
@@ -0,0 +1,55 @@
+"""JSON log formatting for structured log aggregation."""
+
+import logging
+from datetime import datetime, timezone
+
+import orjson
+
+# Attributes every LogRecord carries; anything else came from `extra={...}`
+_RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JSONLogFormatter(logging.Formatter):
+    """Render log records as one JSON object per line, including `extra` fields.
+
+    Encoding is done by orjson, which also handles datetimes, non-string
+    dict keys and other non-string extra values without a Python-level
+    `default` hook.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+
+        try:
+            return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits or circular references; a log call
+            # must never raise from the handler
+            fallback = {
+                key: value if isinstance(value, str) else repr(value)
+                for key, value in payload.items()
+            }
+            return orjson.dumps(fallback).decode()
+
+
+def configure_logging(level: str, log_format: str = "text") -> None:
+    """Configure root logging as plain text or JSON lines."""
+    if log_format == "json":
+        handler = logging.StreamHandler()
+        handler.setFormatter(JSONLogFormatter())
+        logging.basicConfig(level=getattr(logging, level), handlers=[handler])
+    else:
+        logging.basicConfig(
+            level=getattr(logging, level),
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        )
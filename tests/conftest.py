@@ -155,3 +155,9 @@ def mock_openai_client():
     mock.chat.completions = MagicMock()
     mock.chat.completions.create = AsyncMock()
     return mock
+
+
+@pytest.fixture(autouse=True)
+def no_entity_retry_backoff(monkeypatch):
+    """Skip the entity guardrail's retry sleeps; unit tests have no LLM to wait for."""
+    monkeypatch.setattr("src.guardrails.entity.INITIAL_BACKOFF_SECONDS", 0)
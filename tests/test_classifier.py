@@ -90,6 +90,30 @@ class TestEmailClassifier:
             assert result.extracted_data.promise_amount == 1500
             assert result.extracted_data.promise_date == date(2024, 1, 20)
 
+    @pytest.mark.asyncio
+    async def test_classify_unparseable_promise_date(self, classifier, sample_classify_request):
+        """Test free-text or impossible promise dates are dropped, keeping other extracted data."""
+        for raw_date in ("next Friday", "2024-02-30"):
+            mock_response = _make_llm_response(
+                {
+                    "classification": "PROMISE_TO_PAY",
+                    "confidence": 0.9,
+                    "reasoning": "Customer commits to pay",
+                    "extracted_data": {"promise_amount": 1500, "promise_date": raw_date},
+                }
+            )
+            classifier.response_cache.clear()
+
+            with patch(
+                "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
+            ) as mock_complete:
+                mock_complete.return_value = mock_response
+
+                result = await classifier.classify(sample_classify_request)
+
+                assert result.extracted_data.promise_amount == 1500
+                assert result.extracted_data.promise_date is None
+
     @pytest.mark.asyncio
     async def test_classify_dispute_email(self, classifier, sample_classify_request):
         """Test classification of dispute email."""
@@ -188,3 +212,136 @@ class TestEmailClassifier:
             result = await classifier.classify(sample_classify_request)
 
             assert result.classification == "OUT_OF_OFFICE"
+
+    @pytest.mark.asyncio
+    async def test_classify_repeat_email_served_from_cache(
+        self, classifier, sample_classify_request
+    ):
+        """Test an identical repeat email reuses the cached classification."""
+        mock_response = _make_llm_response(
+            {
+                "classification": "OUT_OF_OFFICE",
+                "confidence": 0.99,
+                "reasoning": None,
+                "extracted_data": None,
+            }
+        )
+
+        with patch(
+            "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
+        ) as mock_complete:
+            mock_complete.return_value = mock_response
+
+            first = await classifier.classify(sample_classify_request)
+            second = await classifier.classify(sample_classify_request)
+
+            assert mock_complete.call_count == 1
+            assert second.classification == first.classification
+            assert first.tokens_used == 100
+            assert second.tokens_used == 0
+
+            body = sample_classify_request.email.body
+            sample_classify_request.email.body = "  " + body.replace(" ", "\n") + "\n\n"
+            await classifier.classify(sample_classify_request)
+
+            assert mock_complete.call_count == 1
+
+            # Case is kept in the key; it can be echoed into extracted data
+            sample_classify_request.email.body = body.upper()
+            await classifier.classify(sample_classify_request)
+
+            assert mock_complete.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_classify_concurrent_duplicates_share_llm_call(
+        self, classifier, sample_classify_request
+    ):
+        """Test identical emails classified concurrently make a single LLM call."""
+        import asyncio
+
+        mock_response = _make_llm_response(
+            {
+                "classification": "COOPERATIVE",
+                "confidence": 0.9,
+                "reasoning": None,
+                "extracted_data": None,
+            }
+        )
+
+        async def slow_complete(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        with patch(
+            "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
+        ) as mock_complete:
+            mock_complete.side_effect = slow_complete
+
+            results = await asyncio.gather(
+                classifier.classify(sample_classify_request),
+                classifier.classify(sample_classify_request),
+                classifier.classify(sample_classify_request),
+            )
+
+            assert mock_complete.call_count == 1
+            assert {r.classification for r in results} == {"COOPERATIVE"}
+            assert sorted(r.tokens_used for r in results) == [0, 0, 100]
+            assert classifier._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_classify_caches_result_when_first_caller_cancelled(
+        self, classifier, sample_classify_request
+    ):
+        """Test a coalesced call is cached even if the caller that started it is cancelled."""
+        import asyncio
+
+        mock_response = _make_llm_response(
+            {
+                "classification": "COOPERATIVE",
+                "confidence": 0.9,
+                "reasoning": None,
+                "extracted_data": None,
+            }
+        )
+
+        async def slow_complete(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        with patch(
+            "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
+        ) as mock_complete:
+            mock_complete.side_effect = slow_complete
+
+            first = asyncio.ensure_future(classifier.classify(sample_classify_request))
+            await asyncio.sleep(0)
+            joiner = asyncio.ensure_future(classifier.classify(sample_classify_request))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            assert (await joiner).classification == "COOPERATIVE"
+            repeat = await classifier.classify(sample_classify_request)
+
+            assert first.cancelled()
+            assert mock_complete.call_count == 1
+            assert repeat.tokens_used == 0
+
+    @pytest.mark.asyncio
+    async def test_classify_handles_non_json_response(self, classifier, sample_classify_request):
+        """Test classifier raises a structured error when the LLM returns non-JSON text."""
+        mock_response = LLMResponse(
+            content="Sorry, I cannot help with that.",
+            model="test-model",
+            provider="test",
+            usage={"total_tokens": 10},
+        )
+
+        with patch(
+            "src.engine.classifier.llm_client.complete", new_callable=AsyncMock
+        ) as mock_complete:
+            mock_complete.return_value = mock_response
+
+            with pytest.raises(LLMResponseInvalidError) as exc_info:
+                await classifier.classify(sample_classify_request)
+
+            assert exc_info.value.details["validation_errors"][0]["type"] == "json_invalid"
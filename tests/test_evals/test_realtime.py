@@ -183,3 +183,21 @@ class TestRealTimeEvaluator:
         assert stats["guardrail_pass_rate"] == 1.0
         assert stats["avg_latency_ms"] == 100.0
         assert stats["avg_tokens_used"] == 100
+
+    def test_summary_stats_reset_after_flush(self, sample_classify_request):
+        """Test summary statistics only cover metrics buffered since the last flush."""
+        evaluator = RealTimeEvaluator()
+        evaluator._buffer_size = 2
+
+        for latency in (100.0, 200.0, 400.0):
+            evaluator.evaluate_classification(
+                request=sample_classify_request,
+                response=ClassifyResponse(classification="COOPERATIVE", confidence=0.9),
+                latency_ms=latency,
+            )
+
+        stats = evaluator.get_summary_stats()
+
+        assert stats["total_requests"] == 1
+        assert stats["avg_latency_ms"] == 400.0
+        assert stats["avg_tokens_used"] == 0
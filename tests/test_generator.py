@@ -98,3 +98,103 @@ class TestDraftGenerator:
 
             assert isinstance(result, GenerateDraftResponse)
             assert len(result.invoices_referenced) == 0
+
+    @pytest.mark.asyncio
+    async def test_generate_draft_cache_hit(self, generator, sample_case_context):
+        """Test an identical request reuses the guardrail-passing draft without an LLM call."""
+        from src.api.models.requests import GenerateDraftRequest
+        from src.guardrails.base import GuardrailPipelineResult
+
+        request = GenerateDraftRequest(context=sample_case_context, tone="professional")
+        mock_response = _make_llm_response(
+            {"subject": "Account update", "body": "Dear Customer, please get in touch."},
+            tokens=120,
+        )
+        passed = GuardrailPipelineResult(all_passed=True, should_block=False, results=[])
+
+        with (
+            patch(
+                "src.engine.generator.llm_client.complete", new_callable=AsyncMock
+            ) as mock_complete,
+            patch("src.engine.generator.guardrail_pipeline.validate", return_value=passed),
+        ):
+            mock_complete.return_value = mock_response
+
+            first = await generator.generate(request)
+            second = await generator.generate(request)
+
+            assert mock_complete.await_count == 1
+            assert second.body == first.body
+            assert first.tokens_used == 120
+            assert second.tokens_used == 0
+
+            request.tone = "firm"
+            await generator.generate(request)
+            assert mock_complete.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_many_bounds_concurrency(self, generator, sample_case_context):
+        """Test bulk generation keeps order, caps in-flight calls and returns per-request errors."""
+        import asyncio
+
+        from src.api.models.requests import GenerateDraftRequest
+
+        tones = ["friendly_reminder", "professional", "firm", "final_notice"]
+        requests = [GenerateDraftRequest(context=sample_case_context, tone=t) for t in tones]
+        in_flight = 0
+        peak = 0
+
+        async def fake_complete(system_prompt, user_prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "Tone: firm" in user_prompt:
+                raise RuntimeError("provider down")
+            return _make_llm_response({"subject": "Update", "body": "Please get in touch."})
+
+        with patch("src.engine.generator.llm_client.complete", side_effect=fake_complete):
+            results = await generator.generate_many(requests, max_concurrency=2)
+
+        assert peak == 2
+        assert [getattr(r, "tone_used", None) for r in results] == [
+            "friendly_reminder",
+            "professional",
+            None,
+            "final_notice",
+        ]
+        assert isinstance(results[2], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_generate_draft_warnings_do_not_retry(self, generator, sample_case_context):
+        """Test warning-only guardrail failures are reported without another LLM call."""
+        from src.api.models.requests import GenerateDraftRequest
+        from src.guardrails.base import GuardrailPipelineResult, GuardrailResult, GuardrailSeverity
+
+        request = GenerateDraftRequest(context=sample_case_context, tone="professional")
+        warning = GuardrailResult(
+            passed=False,
+            guardrail_name="tone",
+            severity=GuardrailSeverity.MEDIUM,
+            message="Tone slightly firmer than requested",
+        )
+        warnings_only = GuardrailPipelineResult(
+            all_passed=False, should_block=False, results=[warning]
+        )
+
+        with (
+            patch(
+                "src.engine.generator.llm_client.complete", new_callable=AsyncMock
+            ) as mock_complete,
+            patch("src.engine.generator.guardrail_pipeline.validate", return_value=warnings_only),
+        ):
+            mock_complete.return_value = _make_llm_response(
+                {"subject": "Account update", "body": "Dear Customer, please get in touch."}
+            )
+
+            result = await generator.generate(request)
+
+            assert mock_complete.await_count == 1
+            assert result.guardrail_validation.all_passed is False
+            assert result.guardrail_validation.warnings == ["tone"]
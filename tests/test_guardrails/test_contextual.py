@@ -0,0 +1,63 @@
+"""Tests for Contextual Coherence Guardrail."""
+
+import pytest
+
+from src.guardrails.contextual import ContextualCoherenceGuardrail
+
+
+@pytest.fixture
+def guardrail() -> ContextualCoherenceGuardrail:
+    """Create guardrail instance."""
+    return ContextualCoherenceGuardrail()
+
+
+class TestContextualCoherenceGuardrail:
+    """Tests for ContextualCoherenceGuardrail."""
+
+    def test_no_special_conditions_passes(self, guardrail, sample_case_context):
+        """Test plain context passes without phrase checks."""
+        sample_case_context.broken_promises_count = 0
+
+        results = guardrail.validate("Please pay invoice INV-12345.", sample_case_context)
+
+        assert len(results) == 1
+        assert results[0].passed
+
+    def test_dispute_demand_without_acknowledgment_fails(self, guardrail, sample_case_context):
+        """Test payment demands during a dispute fail, matching case-insensitively."""
+        sample_case_context.active_dispute = True
+        sample_case_context.broken_promises_count = 0
+
+        results = guardrail.validate("You MUST PAY NOW or face Legal Action.", sample_case_context)
+
+        assert not results[0].passed
+        assert results[0].details["demand_phrases_found"] == ["pay now", "must pay", "legal action"]
+
+    def test_dispute_acknowledged_passes(self, guardrail, sample_case_context):
+        """Test acknowledging the dispute passes."""
+        sample_case_context.active_dispute = True
+        sample_case_context.broken_promises_count = 0
+
+        results = guardrail.validate("Your dispute is Under Review.", sample_case_context)
+
+        assert results[0].passed
+
+    def test_hardship_harsh_without_empathy_fails(self, guardrail, sample_case_context):
+        """Test harsh language without empathy fails for hardship cases."""
+        sample_case_context.hardship_indicated = True
+        sample_case_context.broken_promises_count = 0
+
+        results = guardrail.validate("We will be forced to escalate.", sample_case_context)
+
+        assert not results[0].passed
+        assert results[0].found == ["will be forced"]
+
+    def test_broken_promises_require_history_reference(self, guardrail, sample_case_context):
+        """Test repeated broken promises must be acknowledged."""
+        sample_case_context.broken_promises_count = 2
+
+        missing = guardrail.validate("Please settle the balance.", sample_case_context)
+        present = guardrail.validate("As PREVIOUSLY agreed, please pay.", sample_case_context)
+
+        assert not missing[0].passed
+        assert present[0].passed
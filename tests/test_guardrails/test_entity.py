@@ -0,0 +1,222 @@
+"""Tests for Entity Verification Guardrail."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+
+from src.api.models.responses import ExtractedData
+from src.guardrails.entity import EntityVerificationGuardrail
+from src.llm.base import LLMResponse
+
+
+@pytest.fixture
+def guardrail() -> EntityVerificationGuardrail:
+    """Create guardrail instance."""
+    return EntityVerificationGuardrail()
+
+
+def _llm_response(**overrides) -> LLMResponse:
+    """Build a structured entity validation response."""
+    payload = {
+        "customer_code_valid": True,
+        "customer_code_reason": "Customer code not mentioned",
+        "party_name_valid": True,
+        "party_name_reason": "Party name matches",
+        "issues_found": [],
+        "passed": True,
+        **overrides,
+    }
+    return LLMResponse(
+        content=orjson.dumps(payload).decode(),
+        model="test-model",
+        provider="test",
+        usage={"total_tokens": 10},
+    )
+
+
+class TestEntityVerificationGuardrail:
+    """Tests for EntityVerificationGuardrail."""
+
+    def test_event_loop_reused_across_validations(self, guardrail, sample_case_context):
+        """Test consecutive validations on one thread share a single event loop."""
+        loops = []
+
+        async def complete(**kwargs):
+            loops.append(asyncio.get_running_loop())
+            return _llm_response()
+
+        with patch("src.guardrails.entity.llm_client.complete", AsyncMock(side_effect=complete)):
+            first = guardrail.validate("Dear Acme Corp, please pay.", sample_case_context)
+            second = guardrail.validate("Dear Acme Corp, please settle.", sample_case_context)
+
+        assert all(r.passed for r in first + second)
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+        assert not loops[0].is_closed()
+
+    def test_repeat_validation_uses_cache(self, guardrail, sample_case_context):
+        """Test re-validating the same draft for the same party skips the LLM."""
+        complete = AsyncMock(return_value=_llm_response())
+
+        with patch("src.guardrails.entity.llm_client.complete", complete):
+            first = guardrail.validate("Dear Acme Corp, please pay.", sample_case_context)
+            second = guardrail.validate("Dear Acme Corp, please pay.", sample_case_context)
+            sample_case_context.party.name = "Globex Ltd"
+            guardrail.validate("Dear Acme Corp, please pay.", sample_case_context)
+
+        assert complete.await_count == 2
+        assert [r.message for r in first] == [r.message for r in second]
+
+    def test_party_name_mismatch_fails(self, guardrail, sample_case_context):
+        """Test a party name mismatch reported by the LLM fails the guardrail."""
+        response = _llm_response(
+            party_name_valid=False, party_name_reason="Addresses Globex", passed=False
+        )
+
+        with patch("src.guardrails.entity.llm_client.complete", AsyncMock(return_value=response)):
+            results = guardrail.validate("Dear Globex, please pay.", sample_case_context)
+
+        assert results[0].passed
+        assert not results[1].passed
+        assert results[1].message == "Addresses Globex"
+
+    def test_validate_batch_runs_checks_concurrently(self, guardrail, sample_case_context):
+        """Test batched drafts share one loop run and keep input order."""
+        in_flight = 0
+        peak = 0
+
+        async def complete(user_prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if "Globex" in user_prompt:
+                return _llm_response(party_name_valid=False, passed=False)
+            return _llm_response()
+
+        drafts = [
+            ("Dear Acme Corp, please pay.", sample_case_context),
+            ("Dear Globex, please pay.", sample_case_context),
+            ("Dear Accounts Team, please pay.", sample_case_context),
+        ]
+        with patch("src.guardrails.entity.llm_client.complete", AsyncMock(side_effect=complete)):
+            results = guardrail.validate_batch(drafts)
+
+        assert peak == 3
+        assert [all(r.passed for r in draft) for draft in results] == [True, False, True]
+
+    def test_emails_only_from_extracted_data(self, guardrail, sample_case_context):
+        """Test drafts without addresses pass and unknown addresses fail email validation."""
+        extracted = ExtractedData(redirect_email="ap@acme.com")
+
+        plain = guardrail._validate_emails("Please pay today.", sample_case_context, extracted)
+        known = guardrail._validate_emails("Write to AP@acme.com.", sample_case_context, extracted)
+        unknown = guardrail._validate_emails("Write to x@evil.com.", sample_case_context, extracted)
+
+        assert plain.passed
+        assert known.passed
+        assert not unknown.passed
+        assert unknown.found == ["x@evil.com"]
+
+    def test_incomplete_llm_response_fails(self, guardrail, sample_case_context):
+        """Test a response missing schema fields fails, without retrying, instead of passing."""
+        response = LLMResponse(content="{}", model="test-model", provider="test", usage={})
+        complete = AsyncMock(return_value=response)
+
+        with patch("src.guardrails.entity.llm_client.complete", complete):
+            results = guardrail.validate("Dear Acme Corp, please pay.", sample_case_context)
+
+        assert complete.await_count == 1
+        assert len(results) == 1
+        assert not results[0].passed
+
+    def test_transient_llm_error_retried(self, guardrail, sample_case_context):
+        """Test a failed LLM call is retried on the event loop and then passes."""
+        complete = AsyncMock(side_effect=[TimeoutError("LLM timed out"), _llm_response()])
+
+        with patch("src.guardrails.entity.llm_client.complete", complete):
+            results = guardrail.validate("Dear Acme Corp, please pay.", sample_case_context)
+
+        assert complete.await_count == 2
+        assert all(r.passed for r in results)
+
+    def test_stuck_llm_call_hits_overall_deadline(
+        self, guardrail, sample_case_context, monkeypatch
+    ):
+        """Test retries stop at the overall deadline and fail the guardrail."""
+
+        async def hang(**kwargs):
+            await asyncio.sleep(3600)
+
+        # Settings are frozen, so swap the module's reference for the test
+        monkeypatch.setattr(
+            "src.guardrails.entity.settings",
+            SimpleNamespace(guardrail_llm_deadline_seconds=0.01),
+        )
+        with patch("src.guardrails.entity.llm_client.complete", AsyncMock(side_effect=hang)):
+            results = guardrail.validate("Dear Acme Corp, please pay.", sample_case_context)
+
+        assert len(results) == 1
+        assert not results[0].passed
+        assert "deadline" in results[0].message
+
+    def test_primary_timeout_falls_back_within_deadline(
+        self, guardrail, sample_case_context, monkeypatch
+    ):
+        """Test a primary that runs to its own timeout still lets the fallback answer."""
+        from src.llm.factory import LLMProviderWithFallback
+
+        async def primary_times_out(*args, **kwargs):
+            await asyncio.sleep(0.02)
+            raise TimeoutError("primary timed out")
+
+        # The primary uses its full provider timeout; the check's deadline is larger
+        monkeypatch.setattr(
+            "src.guardrails.entity.settings",
+            SimpleNamespace(llm_timeout_seconds=0.02, guardrail_llm_deadline_seconds=1),
+        )
+
+        client = LLMProviderWithFallback(primary_provider="gemini", fallback_provider="openai")
+        client._primary = SimpleNamespace(
+            provider_name="gemini", complete=AsyncMock(side_effect=primary_times_out)
+        )
+        client._fallback = SimpleNamespace(
+            provider_name="openai", complete=AsyncMock(return_value=_llm_response())
+        )
+
+        with patch("src.guardrails.entity.llm_client", client):
+            results = guardrail.validate("Dear Acme Corp, please pay.", sample_case_context)
+
+        assert all(r.passed for r in results)
+        client._primary.complete.assert_awaited_once()
+        client._fallback.complete.assert_awaited_once()
+
+    def test_provider_parsing_error_not_retried(self, guardrail, sample_case_context):
+        """Test a structured-output parsing failure from the provider fails without retrying."""
+        from langchain_core.exceptions import OutputParserException
+        from langchain_core.messages import AIMessage
+
+        from src.llm.openai_provider import OpenAIProvider
+
+        provider = OpenAIProvider(api_key="test-key")
+        runnable = AsyncMock()
+        runnable.ainvoke.return_value = {
+            "raw": AIMessage(content="not the schema"),
+            "parsed": None,
+            "parsing_error": OutputParserException("Invalid json output: not the schema"),
+        }
+
+        with (
+            patch.object(provider, "_get_client", return_value=runnable),
+            patch("src.guardrails.entity.llm_client", provider),
+        ):
+            results = guardrail.validate("Dear Acme Corp, please pay.", sample_case_context)
+
+        runnable.ainvoke.assert_awaited_once()
+        assert len(results) == 1
+        assert not results[0].passed
+        assert "Invalid json output" in results[0].message
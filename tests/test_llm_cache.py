@@ -0,0 +1,58 @@
+"""Unit tests for LLMResponseCache."""
+
+from unittest.mock import patch
+
+from src.llm.cache import LLMResponseCache, normalize_prompt
+
+
+class TestLLMResponseCache:
+    """Tests for the exact-match LLM response cache."""
+
+    def test_key_depends_on_prompts_and_temperature(self):
+        """Test cache keys change with any prompt or temperature change."""
+        key = LLMResponseCache.make_key("system", "user", 0.2)
+
+        assert key == LLMResponseCache.make_key("system", "user", 0.2)
+        assert key != LLMResponseCache.make_key("system", "user2", 0.2)
+        assert key != LLMResponseCache.make_key("system2", "user", 0.2)
+        assert key != LLMResponseCache.make_key("system", "user", 0.3)
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted when full."""
+        cache = LLMResponseCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_expired_entries_are_misses(self):
+        """Test entries are dropped once their TTL has passed."""
+        cache = LLMResponseCache(max_entries=10, ttl_seconds=60)
+        with patch("src.llm.cache.time.monotonic", return_value=1000.0):
+            cache.set("a", 1)
+        with patch("src.llm.cache.time.monotonic", return_value=1061.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_zero_entries_disables_cache(self):
+        """Test max_entries=0 never stores anything."""
+        cache = LLMResponseCache(max_entries=0, ttl_seconds=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_normalize_prompt_ignores_whitespace(self):
+        """Test prompts differing only in whitespace normalize identically."""
+        assert normalize_prompt("I  already paid\n\nthis invoice ") == normalize_prompt(
+            "I already paid this invoice"
+        )
+        assert normalize_prompt("I already paid") != normalize_prompt("I have not paid")
+
+    def test_normalize_prompt_preserves_case(self):
+        """Test case differences, which can be echoed into extracted data, keep separate keys."""
+        assert normalize_prompt("Contact AP@Acme.com") != normalize_prompt("Contact ap@acme.com")
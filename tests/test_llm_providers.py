@@ -230,3 +230,123 @@ class TestLLMProviders:
             print("⚠️  Only Gemini working - OpenAI fallback unavailable")
         else:
             print("⚠️  Only OpenAI working - Gemini primary unavailable")
+
+    @pytest.mark.asyncio
+    async def test_openai_clients_reused_per_configuration(self):
+        """Test chat clients are built once per configuration and share one HTTP pool."""
+        import asyncio
+
+        provider = OpenAIProvider(api_key="test-key")
+        pool = provider._get_http_client(asyncio.get_running_loop())
+
+        first = provider._get_client(0.2, 100)
+        assert provider._get_client(0.2, 100) is first
+        assert provider._get_client(0.7, 100) is not first
+        assert first.http_async_client is pool
+        assert provider._get_client(0.7, 100).http_async_client is pool
+
+        await provider.aclose()
+        assert pool.is_closed
+
+    def test_openai_http_pool_per_event_loop(self):
+        """Test each event loop gets its own connection pool, reused across calls."""
+        import asyncio
+
+        provider = OpenAIProvider(api_key="test-key")
+
+        async def pool_for_call():
+            return provider._get_client(0.2, 100).http_async_client
+
+        loop = asyncio.new_event_loop()
+        other_loop = asyncio.new_event_loop()
+        try:
+            first = loop.run_until_complete(pool_for_call())
+            assert loop.run_until_complete(pool_for_call()) is first
+            assert other_loop.run_until_complete(pool_for_call()) is not first
+        finally:
+            loop.close()
+            other_loop.close()
+
+    def test_closed_loops_released_and_pools_closed_per_loop(self):
+        """Test aclose() closes a loop's pools and closed loops are dropped from the caches."""
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+
+        from src.llm.gemini_provider import GeminiProvider
+
+        openai = OpenAIProvider(api_key="test-key")
+        gemini = GeminiProvider(api_key="test-key")
+
+        async def open_clients():
+            openai._get_client(0.2, 100)
+            gemini._get_client(0.2, 100)
+            return asyncio.get_running_loop()
+
+        worker_loop = asyncio.new_event_loop()
+        closed_loop = asyncio.new_event_loop()
+        try:
+            worker = worker_loop.run_until_complete(open_clients())
+            pool = openai._http_clients[worker]
+            chat_model = gemini._chat_models[worker][0]
+            closed = closed_loop.run_until_complete(open_clients())
+            closed_loop.close()
+
+            # A new loop's first call prunes the closed one
+            asyncio.run(open_clients())
+            assert closed not in openai._clients
+            assert closed not in openai._http_clients
+            assert closed not in gemini._clients
+            assert closed not in gemini._chat_models
+
+            worker_loop.run_until_complete(openai.aclose())
+            with patch.object(chat_model.client.aio, "aclose", AsyncMock()) as gemini_close:
+                worker_loop.run_until_complete(gemini.aclose())
+            assert pool.is_closed
+            assert worker not in openai._clients
+            assert worker not in gemini._chat_models
+            gemini_close.assert_awaited_once()
+        finally:
+            worker_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_structured_output_reports_usage(self):
+        """Test structured calls report token usage, including prompt-cache reads."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from langchain_core.messages import AIMessage
+
+        from src.llm.schemas import DraftGenerationLLMResponse
+
+        provider = OpenAIProvider(api_key="test-key")
+        raw = AIMessage(
+            content="",
+            usage_metadata={
+                "input_tokens": 1200,
+                "output_tokens": 80,
+                "total_tokens": 1280,
+                "input_token_details": {"cache_read": 1024},
+            },
+        )
+        client = MagicMock()
+        client.ainvoke = AsyncMock(
+            return_value={
+                "raw": raw,
+                "parsed": DraftGenerationLLMResponse(subject="Hi", body="Body"),
+                "parsing_error": None,
+            }
+        )
+
+        with patch.object(provider, "_get_client", return_value=client):
+            response = await provider.complete(
+                system_prompt="system",
+                user_prompt="user",
+                response_schema=DraftGenerationLLMResponse,
+            )
+
+        assert response.usage == {
+            "prompt_tokens": 1200,
+            "completion_tokens": 80,
+            "total_tokens": 1280,
+            "cached_tokens": 1024,
+        }
+        await provider.aclose()
@@ -0,0 +1,41 @@
+"""Tests for JSON log formatting."""
+
+import logging
+
+import orjson
+
+from src.utils.logging_config import JSONLogFormatter
+
+
+def _record(**extra) -> logging.LogRecord:
+    """Build a log record carrying extra fields."""
+    record = logging.makeLogRecord({"name": "test", "levelname": "INFO", "msg": "hello"})
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJSONLogFormatter:
+    """Tests for JSONLogFormatter."""
+
+    def test_extra_fields_included(self):
+        """Test extra fields are rendered alongside the standard ones."""
+        line = JSONLogFormatter().format(_record(metric_type="llm_call", latency_ms=12.5))
+
+        payload = orjson.loads(line)
+        assert payload["message"] == "hello"
+        assert payload["metric_type"] == "llm_call"
+        assert payload["latency_ms"] == 12.5
+
+    def test_non_str_dict_keys_encoded(self):
+        """Test extra dicts keyed by non-strings don't break the handler."""
+        line = JSONLogFormatter().format(_record(counts={1: "one", None: "none"}))
+
+        assert orjson.loads(line)["counts"] == {"1": "one", "null": "none"}
+
+    def test_unencodable_values_fall_back_to_repr(self):
+        """Test values orjson rejects are logged as their repr."""
+        line = JSONLogFormatter().format(_record(big=2**70))
+
+        payload = orjson.loads(line)
+        assert payload["big"] == repr(2**70)
+        assert payload["message"] == "hello"